@@ -3,23 +3,31 @@
 
 Creates JSON fixtures for each question that can be used for testing.
 Naming convention: {course}-{exam_id}-{question_num:02d}.json
+(or .json.gz with --compress, the format used in tests/fixtures/questions/)
 
 Usage:
-    uv run scripts/extract_question_fixtures.py path/to/exam.pdf -o tests/fixtures/questions/
+    uv run scripts/extract_question_fixtures.py path/to/exam.pdf -o tests/fixtures/questions/ --compress
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
-import fitz
+from disa_parser import DISAParser, QuestionType
+from disa_parser.fixture import dump_page, dumps_fixture
 
-from disa_parser import DISAParser
-from disa_parser.fixture import FixtureEncoder, dump_page
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+# Exam ID prefix of DISA filenames: {id}_{description}.pdf
+_EXAM_ID_RE = re.compile(r"^([A-Za-z0-9]+)_")
 
 
 def extract_exam_id(filename: str) -> str:
@@ -29,112 +37,195 @@ def extract_exam_id(filename: str) -> str:
     E.g., CiyL1wzjXlQxVHpLMxf7_Fysiologi_delskrivning_2_VT24.pdf
     """
     # Extract the ID part (before first underscore)
-    match = re.match(r"^([A-Za-z0-9]+)_", filename)
+    match = _EXAM_ID_RE.match(filename)
     if match:
         return match.group(1)
     # Fallback to filename stem
     return Path(filename).stem[:20]
 
 
+# O_CLOEXEC is POSIX-only and O_BINARY Windows-only
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes with raw os-level calls, skipping Python's buffered file objects."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def is_unchanged(path: Path, data: bytes) -> bool:
+    """Check whether path already holds exactly these bytes."""
+    try:
+        # A size mismatch settles most changed fixtures without reading them
+        if os.stat(path).st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
 def extract_question_fixtures(
     pdf_path: Path,
     course: str,
     output_dir: Path,
-) -> list[Path]:
+    compress: bool = False,
+    always_toc: bool = False,
+    images: bool = True,
+    pretty: bool = False,
+) -> Iterator[Path]:
     """Extract per-question fixtures from an exam PDF.
 
     Args:
         pdf_path: Path to the exam PDF
         course: Course identifier
         output_dir: Directory to save fixtures
-
-    Returns:
-        List of paths to created fixture files
+        compress: Write gzip-compressed .json.gz files
+        always_toc: Include TOC pages 0-5 even for questions whose type
+            was not found in the TOC
+        images: Keep image blocks (and their binary payloads) in text_dict
+        pretty: Indent the JSON for reading; load_fixture accepts either form
+
+    Yields:
+        Path of each fixture file as soon as it is written; files that
+        already hold the same bytes are left alone and not yielded
     """
     # Parse the exam to get question boundaries
     parser = DISAParser(pdf_path, course)
-    exam = parser.parse()
-    parser.close()
-
-    if not exam.questions:
-        print(f"No questions found in {pdf_path}")
-        return []
-
-    # Open PDF again to extract page data
-    doc = fitz.open(pdf_path)
-    exam_id = extract_exam_id(pdf_path.name)
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    created_files = []
-
-    # Group questions by page for efficient extraction
-    questions_by_page: dict[int, list[tuple[int, Any]]] = {}
-    for q in exam.questions:
-        if q.page_num not in questions_by_page:
-            questions_by_page[q.page_num] = []
-        questions_by_page[q.page_num].append((q.number, q))
-
-    for question in exam.questions:
-        # Collect pages for this question (current page + possibly next)
-        pages_to_include = [question.page_num]
-
-        # Find next question to determine page range
-        next_q = None
-        for q in exam.questions:
-            if q.number == question.number + 1:
-                next_q = q
-                break
-
-        # Include pages until next question
-        if next_q and next_q.page_num > question.page_num:
-            pages_to_include.extend(range(question.page_num + 1, next_q.page_num + 1))
-
-        # Always include TOC pages (0-5) for question type detection
-        toc_pages = list(range(min(6, len(doc))))
-        pages_to_include = sorted(set(toc_pages + pages_to_include))
-
-        pages_to_include = sorted(set(pages_to_include))
-
-        # Build fixture
-        fixture = {
-            "source": pdf_path.name,
-            "exam_id": exam_id,
-            "course": course,
-            "page_count": len(doc),
-            "question": {
-                "number": question.number,
-                "type": question.question_type,
-                "text": question.text,
-                "answer": question.answer,
-                "points": question.points,
-                "category": question.category,
-                "options": [{"text": o.text, "is_correct": o.is_correct} for o in question.options],
-                "page_num": question.page_num,
-                "y_position": question.y_position,
-            },
-            "pages": {},
-        }
-
-        for page_num in pages_to_include:
-            if 0 <= page_num < len(doc):
-                fixture["pages"][str(page_num)] = dump_page(doc[page_num])
-
-        # Save fixture
-        filename = f"{course}-{exam_id}-{question.number:02d}.json"
-        filepath = output_dir / filename
-        filepath.write_text(json.dumps(fixture, indent=2, cls=FixtureEncoder))
-        created_files.append(filepath)
-        print(f"  Created: {filename}")
-
-    doc.close()
-    return created_files
+    try:
+        exam = parser.parse()
+
+        if not exam.questions:
+            print(f"No questions found in {pdf_path}")
+            return
+
+        # Reuse the parser's open document to extract page data
+        doc = parser.doc
+        exam_id = extract_exam_id(pdf_path.name)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Only the next question's page is needed, so index plain ints by number
+        page_by_number = {q.number: q.page_num for q in exam.questions}
+
+        # Pages are shared between fixtures (TOC pages 0-5 are in every one and
+        # multi-page questions overlap their neighbours), so dump each page once
+        page_count = len(doc)
+        toc_pages = frozenset(range(min(6, page_count)))
+        # Pages 0-1 are always needed for format and metadata detection
+        header_pages = frozenset(range(min(2, page_count)))
+        page_cache: dict[int, dict] = {}
+
+        # Every fixture of this exam shares the same filename prefix and suffix
+        prefix = f"{course}-{exam_id}-"
+        suffix = ".json.gz" if compress else ".json"
+
+        for question in exam.questions:
+            # Collect pages for this question (current page + possibly next)
+            first_page = last_page = question.page_num
+
+            # Questions come in page order, so pages before this one are only
+            # reused if they are TOC pages; drop the rest to bound memory
+            for page_num in [p for p in page_cache if p < first_page and p not in toc_pages]:
+                del page_cache[page_num]
+
+            # Include pages until next question; most questions fit on one page
+            next_page = page_by_number.get(question.number + 1)
+            if next_page is not None and next_page > first_page:
+                last_page = next_page
+
+            # Include TOC pages (0-5) when the type came from the TOC, so the
+            # fixture reproduces question type detection
+            if always_toc or question.question_type != QuestionType.UNKNOWN.value:
+                base_pages = toc_pages
+            else:
+                base_pages = header_pages
+            pages_to_include = sorted(base_pages.union(range(first_page, last_page + 1)))
+
+            # Build fixture
+            fixture = {
+                "source": pdf_path.name,
+                "exam_id": exam_id,
+                "course": course,
+                "page_count": page_count,
+                "question": {
+                    "number": question.number,
+                    "type": question.question_type,
+                    "text": question.text,
+                    "answer": question.answer,
+                    "points": question.points,
+                    "category": question.category,
+                    # Option dataclasses serialize as {"text", "is_correct"}
+                    "options": question.options,
+                    "page_num": question.page_num,
+                    "y_position": question.y_position,
+                },
+                "pages": {},
+            }
+
+            for page_num in pages_to_include:
+                if 0 <= page_num < page_count:
+                    if page_num not in page_cache:
+                        page_cache[page_num] = dump_page(doc[page_num], images)
+                    fixture["pages"][str(page_num)] = page_cache[page_num]
+
+            # Save fixture
+            filename = f"{prefix}{question.number:02d}{suffix}"
+            filepath = output_dir / filename
+            data = dumps_fixture(fixture, pretty)
+            if compress:
+                # Level 1 is near line-speed and the page text compresses well;
+                # a fixed mtime keeps the output reproducible across runs
+                data = gzip.compress(data, compresslevel=1, mtime=0)
+            if is_unchanged(filepath, data):
+                print(f"  Unchanged: {filename}")
+                continue
+            write_bytes(filepath, data)
+            print(f"  Created: {filename}")
+            # Hand each path over as it is written so the fixture dict can be
+            # freed before the next question is built
+            yield filepath
+    finally:
+        parser.close()
+
+
+def _extract_to_list(*job) -> list[Path]:
+    """Run extract_question_fixtures to completion in a worker process.
+
+    Returns the paths of the fixtures that were written.
+    """
+    return list(extract_question_fixtures(*job))
+
+
+def detect_course(pdf_path: Path) -> str:
+    """Detect the course from the directory layout.
+
+    Scraped exams live in scraped_data/{course}/files/{exam}.pdf.
+    """
+    course = pdf_path.parent.parent.name
+    if course == "files":
+        course = pdf_path.parent.parent.parent.name
+    return course
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Extract per-question fixtures from DISA exam PDFs"
     )
-    parser.add_argument("pdf_path", type=Path, help="Path to exam PDF")
+    parser.add_argument(
+        "pdf_paths",
+        type=Path,
+        nargs="+",
+        help="Exam PDFs, or directories to search recursively for PDFs"
+    )
     parser.add_argument(
         "-o", "--output",
         type=Path,
@@ -145,26 +236,81 @@ def main():
         "-c", "--course",
         help="Course name (auto-detected from parent directory if not specified)"
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip-compressed .json.gz fixtures"
+    )
+    parser.add_argument(
+        "--always-toc",
+        action="store_true",
+        help="Include TOC pages 0-5 even for questions of unknown type"
+    )
+    parser.add_argument(
+        "--no-images",
+        dest="images",
+        action="store_false",
+        help="Leave image blocks out of the page dumps (the parser ignores them)"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the fixture JSON (default: compact)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        help="Number of worker processes (default: min(CPU count, 4))"
+    )
     args = parser.parse_args()
 
-    if not args.pdf_path.exists():
-        print(f"Error: {args.pdf_path} not found")
-        return 1
-
-    # Auto-detect course from parent directory name
-    course = args.course
-    if not course:
-        # Try to get course from grandparent (scraped_data/course/files/exam.pdf)
-        course = args.pdf_path.parent.parent.name
-        if course == "files":
-            course = args.pdf_path.parent.parent.parent.name
-
-    print(f"Extracting fixtures from: {args.pdf_path}")
-    print(f"Course: {course}")
+    pdf_paths: list[Path] = []
+    for path in args.pdf_paths:
+        if path.is_dir():
+            pdf_paths.extend(sorted(path.glob("**/*.pdf")))
+        elif path.exists():
+            pdf_paths.append(path)
+        else:
+            print(f"Error: {path} not found")
+            return 1
+
+    print(f"Extracting fixtures from {len(pdf_paths)} PDF(s)")
     print(f"Output: {args.output}")
 
-    files = extract_question_fixtures(args.pdf_path, course, args.output)
-    print(f"\nCreated {len(files)} fixture files")
+    jobs = [
+        (
+            pdf_path,
+            args.course or detect_course(pdf_path),
+            args.output,
+            args.compress,
+            args.always_toc,
+            args.images,
+            args.pretty,
+        )
+        for pdf_path in pdf_paths
+    ]
+
+    # PyMuPDF scaling flattens out past ~4-6 processes
+    num_workers = args.workers or min(os.cpu_count() or 1, 4)
+    total = 0
+    if num_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            print(f"\n{job[0]} (course: {job[1]})")
+            total += sum(1 for _ in extract_question_fixtures(*job))
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {executor.submit(_extract_to_list, *job): job for job in jobs}
+            for future in as_completed(futures):
+                pdf_path = futures[future][0]
+                try:
+                    files = future.result()
+                except Exception as e:
+                    print(f"  Error: {pdf_path.name}: {e}")
+                    continue
+                print(f"{pdf_path.name}: {len(files)} fixtures written")
+                total += len(files)
+
+    print(f"\nCreated {total} fixture files")
     return 0
 
 
@@ -38,6 +38,7 @@ from .images import (
     ExtractedImage,
     ImageExtractor,
     QuestionImages,
+    associate_images,
     extract_images_from_exam,
 )
 from .models import (
@@ -73,6 +74,7 @@ __all__ = [
     "ImageExtractor",
     "ExtractedImage",
     "QuestionImages",
+    "associate_images",
     "extract_images_from_exam",
     # Models
     "Question",
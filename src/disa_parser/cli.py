@@ -4,33 +4,70 @@ from __future__ import annotations
 
 import argparse
 import csv
-import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import fitz
 import yaml
 
-from .constants import BLACKLIST, QUESTION_TYPES, TYPE_CODES
-from .parser import DISAParser
+from .constants import BLACKLIST, COURSE_CODES, DATE_PATTERN, QUESTION_TYPES_SET, TYPE_CODES
+from .parser import TEXT_DICT_FLAGS, DISAParser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# libyaml's C emitter is much faster; the exported data is plain types only
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def has_answer(q: dict) -> bool:
     """Check if a question dict has answer data."""
-    if q.get("answer"):
-        return True
-    if q.get("correct"):
+    if q.get("answer") or q.get("correct"):
         return True
-    for opt in q.get("options", []):
-        if opt.get("is_correct"):
-            return True
-    return False
+    options = q.get("options")
+    if not options:
+        return False
+    return any(opt.get("is_correct") for opt in options)
+
+
+def _detect_course(pdf_path: Path) -> str:
+    """Detect the course from a known course directory in the path."""
+    return next((part for part in pdf_path.parts if part in COURSE_CODES), "unknown")
+
+
+def _preview(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut with '...'."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _by_type(totals: Counter[str], answered: Counter[str]) -> dict[str, dict[str, int]]:
+    """Combine per-type question and answer counts for the report."""
+    return {
+        qtype: {"total": total, "with_answer": answered[qtype]}
+        for qtype, total in totals.items()
+    }
+
+
+def _validate_worker(args: tuple[str, str]) -> tuple[list[dict] | None, str | None]:
+    """Worker: Parse exam for validation. Returns (questions, error)."""
+    pdf_path_str, course = args
+    try:
+        parser = DISAParser(Path(pdf_path_str), course)
+        result = parser.parse()
+        parser.close()
+        return (result.to_dict()["questions"], None)
+    except Exception as e:
+        return (None, str(e))
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
     """Run parser validation across all exams."""
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
     csv_file = Path(args.csv or "disa_exams.csv")
     scraped_dir = Path(args.scraped_dir or "../kandidaterna-scraper/scraped_data")
 
@@ -39,9 +76,9 @@ def cmd_validate(args: argparse.Namespace) -> int:
         return 1
 
     results: dict[str, dict] = {}
-    type_totals: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"total": 0, "with_answer": 0}
-    )
+    # Question and answered counts per type code
+    type_totals: Counter[str] = Counter()
+    type_answered: Counter[str] = Counter()
     total_questions = 0
     total_with_answer = 0
     problem_exams: list[tuple[str, int, int]] = []
@@ -49,74 +86,85 @@ def cmd_validate(args: argparse.Namespace) -> int:
     utan_svar: list[str] = []
     missing_questions: list[dict] = []
 
+    # Stream the CSV, keeping only the small job tuples for exams to parse.
+    # Paths stay plain strings; the workers take strings anyway.
+    num_rows = 0
+    base_dir = str(scraped_dir)
+    jobs: list[tuple[str, str, str, str]] = []
     with open(csv_file) as f:
-        rows = list(csv.DictReader(f))
-
-    print(f"Validating {len(rows)} exams...")
+        for row in csv.DictReader(f):
+            num_rows += 1
+            course = row["course"]
+            filename = row["filename"]
+            exam_id = f"{course[:3]}_{filename[:15]}"
+            is_utan_svar = "utan_svar" in filename.lower()
+
+            # Set lookup first; exists() costs a stat() per row
+            if filename in BLACKLIST:
+                continue
+            pdf_path = os.path.join(base_dir, course, "files", filename)
+            if not os.path.exists(pdf_path):
+                continue
 
-    for i, row in enumerate(rows):
-        course = row["course"]
-        filename = row["filename"]
-        pdf_path = scraped_dir / course / "files" / filename
-        exam_id = f"{course[:3]}_{filename[:15]}"
-        is_utan_svar = "utan_svar" in filename.lower()
+            if is_utan_svar:
+                utan_svar.append(exam_id)
+                continue
 
-        if not pdf_path.exists() or filename in BLACKLIST:
-            continue
+            jobs.append((exam_id, pdf_path, course, filename))
 
-        if is_utan_svar:
-            utan_svar.append(exam_id)
-            continue
+    print(f"Validating {num_rows} exams...")
 
-        try:
-            parser = DISAParser(pdf_path, course)
-            result = parser.parse()
-            parser.close()
-            exam = result.to_dict()
-        except Exception as e:
-            print(f"  Error parsing {exam_id}: {e}")
+    # Parse in parallel; map() yields in CSV order so the report and
+    # baseline do not depend on completion order. Chunks amortize the IPC.
+    num_workers = args.workers or os.cpu_count() or 4
+    work_items = [(pdf_path, course) for _, pdf_path, course, _ in jobs]
+    outcomes: list[tuple[list[dict] | None, str | None]] = []
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for outcome in executor.map(_validate_worker, work_items, chunksize=8):
+            outcomes.append(outcome)
+            if len(outcomes) % 50 == 0:
+                print(f"  Processed {len(outcomes)}/{len(jobs)} exams...")
+
+    for (exam_id, pdf_path, course, filename), (questions, error) in zip(jobs, outcomes):
+        if error is not None:
+            print(f"  Error parsing {exam_id}: {error}")
             continue
 
-        exam_data: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"total": 0, "with_answer": 0}
-        )
-        for q in exam["questions"]:
+        resolved_path = os.path.realpath(pdf_path)
+        exam_totals: Counter[str] = Counter()
+        exam_answered: Counter[str] = Counter()
+        for q in questions:
             qtype = TYPE_CODES.get(q.get("type", ""), "unk")
-            exam_data[qtype]["total"] += 1
-            type_totals[qtype]["total"] += 1
-            total_questions += 1
+            exam_totals[qtype] += 1
 
             if has_answer(q):
-                exam_data[qtype]["with_answer"] += 1
-                type_totals[qtype]["with_answer"] += 1
-                total_with_answer += 1
+                exam_answered[qtype] += 1
             else:
                 missing_questions.append(
                     {
-                        "path": str(pdf_path.resolve()),
+                        "path": resolved_path,
                         "course": course,
                         "filename": filename,
                         "q_num": q.get("number", "?"),
                         "q_type": qtype,
                         "q_type_full": q.get("type", "Unknown"),
-                        "q_text": (q.get("text", "")[:80] + "...")
-                        if len(q.get("text", "")) > 80
-                        else q.get("text", ""),
+                        "q_text": _preview(q.get("text") or "", 80),
                     }
                 )
 
-        results[exam_id] = {k: dict(v) for k, v in exam_data.items()}
-        exam_total = sum(d["total"] for d in exam_data.values())
-        exam_with = sum(d["with_answer"] for d in exam_data.values())
+        results[exam_id] = _by_type(exam_totals, exam_answered)
+        type_totals.update(exam_totals)
+        type_answered.update(exam_answered)
+        exam_total = len(questions)
+        exam_with = exam_answered.total()
+        total_questions += exam_total
+        total_with_answer += exam_with
 
         if exam_with == exam_total:
             fully_parsed.append(exam_id)
         else:
             problem_exams.append((exam_id, exam_total, exam_with))
 
-        if (i + 1) % 50 == 0:
-            print(f"  Processed {i + 1}/{len(rows)} exams...")
-
     # Print summary
     print("\n" + "=" * 70)
     print("PARSER VALIDATION REPORT")
@@ -131,8 +179,9 @@ def cmd_validate(args: argparse.Namespace) -> int:
     print("\n" + "-" * 40)
     print("BY TYPE:")
     print("-" * 40)
-    for qtype in sorted(type_totals.keys()):
-        t = type_totals[qtype]
+    by_type = _by_type(type_totals, type_answered)
+    for qtype in sorted(by_type):
+        t = by_type[qtype]
         pct = 100 * t["with_answer"] / t["total"] if t["total"] > 0 else 0
         missing = t["total"] - t["with_answer"]
         status = "OK" if pct == 100 else f"({missing} missing)"
@@ -158,7 +207,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
         for path in sorted(by_exam.keys()):
             questions = by_exam[path]
             print(f"{path}")
-            for q in sorted(questions, key=lambda x: x["q_num"]):
+            for q in sorted(questions, key=itemgetter("q_num")):
                 print(f"  Q{q['q_num']} [{q['q_type']}] {q['q_type_full']}")
                 if q["q_text"]:
                     text_preview = q["q_text"].replace("\n", " ")[:70]
@@ -173,11 +222,11 @@ def cmd_validate(args: argparse.Namespace) -> int:
             "total_with_answer": total_with_answer,
             "fully_parsed": len(fully_parsed),
             "problem_exams": len(problem_exams),
-            "by_type": {k: dict(v) for k, v in type_totals.items()},
+            "by_type": by_type,
             "exams": results,
         }
         with open(baseline_file, "w") as f:
-            yaml.dump(current, f, default_flow_style=False)
+            yaml.dump(current, f, Dumper=YamlDumper, default_flow_style=False)
         print(f"\nBaseline saved to {baseline_file}")
 
     return 0
@@ -190,22 +239,7 @@ def cmd_parse(args: argparse.Namespace) -> int:
         print(f"Error: File not found: {pdf_path}")
         return 1
 
-    # Detect course from path
-    course = "unknown"
-    known_courses = [
-        "anatomi_och_histologi_1",
-        "anatomi_och_histologi_2",
-        "biokemi",
-        "fysiologi",
-        "genetik,_patologi,_pu,_farmakologi_och_konsultation",
-        "infektion,_immunologi,_reumatologi_mfl",
-        "klinisk_anatomi,_radiologi_och_konsultation",
-        "molekylär_cellbiologi_och_utvecklingsbiologi",
-    ]
-    for part in pdf_path.parts:
-        if part in known_courses:
-            course = part
-            break
+    course = _detect_course(pdf_path)
 
     try:
         parser = DISAParser(pdf_path, course)
@@ -216,45 +250,42 @@ def cmd_parse(args: argparse.Namespace) -> int:
         print(f"Error parsing: {e}")
         return 1
 
+    questions = exam["questions"]
     print(f"=== {pdf_path.name} ===")
-    print(f"Total questions: {len(exam['questions'])}")
+    print(f"Total questions: {len(questions)}")
+
+    # Type code and answer status, computed once per question
+    qtypes = [TYPE_CODES.get(q.get("type", ""), "unk") for q in questions]
+    answered = [has_answer(q) for q in questions]
 
-    with_answer = sum(1 for q in exam["questions"] if has_answer(q))
-    print(f"With answers: {with_answer}/{len(exam['questions'])}")
+    print(f"With answers: {sum(answered)}/{len(questions)}")
 
     # Type breakdown
-    by_type: dict[str, list[dict]] = defaultdict(list)
-    for q in exam["questions"]:
-        qtype = TYPE_CODES.get(q.get("type", ""), "unk")
-        by_type[qtype].append(q)
+    type_totals = Counter(qtypes)
+    type_answered = Counter(qtype for qtype, ok in zip(qtypes, answered) if ok)
 
     print("\nBy type:")
-    for qtype, questions in sorted(by_type.items()):
-        answered = sum(1 for q in questions if has_answer(q))
-        print(f"  {qtype}: {answered}/{len(questions)}")
+    for qtype in sorted(type_totals):
+        print(f"  {qtype}: {type_answered[qtype]}/{type_totals[qtype]}")
 
     # Show questions
     limit = args.limit or 10
     print(f"\nFirst {limit} questions:")
-    for q in exam["questions"][:limit]:
-        qtype = TYPE_CODES.get(q.get("type", ""), "unk")
-        answered = "Y" if has_answer(q) else "N"
-        print(f"\n--- Q{q['number']} [{qtype}] answered={answered} ---")
+    for q, qtype, ok in zip(questions[:limit], qtypes, answered):
+        print(f"\n--- Q{q['number']} [{qtype}] answered={'Y' if ok else 'N'} ---")
         print(f"Type: {q['type']}")
         print(f"Points: {q['points']}")
-        text_preview = q["text"][:100] + "..." if len(q["text"]) > 100 else q["text"]
-        print(f"Text: {text_preview}")
+        print(f"Text: {_preview(q['text'], 100)}")
 
         if q.get("options"):
             print(f"Options ({len(q['options'])}):")
             for opt in q["options"][:5]:
                 mark = "*" if opt["is_correct"] else " "
-                opt_text = opt["text"][:60] + "..." if len(opt["text"]) > 60 else opt["text"]
-                print(f"  [{mark}] {opt_text}")
+                print(f"  [{mark}] {_preview(opt['text'], 60)}")
 
-        if q.get("answer"):
-            ans_preview = q["answer"][:100] + "..." if len(q["answer"]) > 100 else q["answer"]
-            print(f"Answer: {ans_preview}")
+        answer = q.get("answer")
+        if answer:
+            print(f"Answer: {_preview(answer, 100)}")
 
     return 0
 
@@ -266,13 +297,13 @@ def cmd_debug_blocks(args: argparse.Namespace) -> int:
         print(f"Error: File not found: {pdf_path}")
         return 1
 
-    doc = fitz.open(pdf_path)
+    doc = fitz.open(pdf_path, filetype="pdf")
     if args.page >= len(doc):
         print(f"Error: Page {args.page} out of range (0-{len(doc)-1})")
         return 1
 
     page = doc[args.page]
-    text_dict = page.get_text("dict")
+    text_dict = page.get_text("dict", flags=TEXT_DICT_FLAGS)
 
     print(f"Page {args.page} of {pdf_path.name}:")
     print()
@@ -308,7 +339,7 @@ def cmd_debug_toc(args: argparse.Namespace) -> int:
         print(f"Error: File not found: {pdf_path}")
         return 1
 
-    doc = fitz.open(pdf_path)
+    doc = fitz.open(pdf_path, filetype="pdf")
 
     results: dict[str, Any] = {
         "numbers": [],
@@ -319,7 +350,7 @@ def cmd_debug_toc(args: argparse.Namespace) -> int:
 
     for page_num in range(min(6, len(doc))):
         page = doc[page_num]
-        text_dict = page.get_text("dict")
+        text_dict = page.get_text("dict", flags=TEXT_DICT_FLAGS)
 
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
@@ -330,13 +361,14 @@ def cmd_debug_toc(args: argparse.Namespace) -> int:
                     x, y = bbox[0], bbox[1]
                     text = span.get("text", "").strip()
 
-                    if re.match(r"^\d{1,3}$", text):
+                    # Same as ^\d{1,3}$ without a regex call per span
+                    if len(text) <= 3 and text.isdecimal():
                         num = int(text)
                         if 1 <= num <= 100:
                             results["numbers"].append((page_num, x, y, num))
                             results["number_x_positions"].add(round(x))
 
-                    if text in QUESTION_TYPES:
+                    if text in QUESTION_TYPES_SET:
                         results["types"].append((page_num, x, y, text))
                         results["type_x_positions"].add(round(x))
 
@@ -360,15 +392,24 @@ def cmd_debug_toc(args: argparse.Namespace) -> int:
     numbers_by_y = {(page, round(y)): num for page, x, y, num in results["numbers"]}
     types_by_y = {(page, round(y)): qtype for page, x, y, qtype in results["types"]}
 
+    # Sweep numbers and types together in (page, y) order. Each number takes
+    # the topmost type within 5pt of it, as probing dy = -5..5 would.
+    type_keys = sorted(types_by_y)
+    type_at: dict[tuple[int, int], str] = {}
+    j = 0
+    for page, y in sorted(numbers_by_y):
+        while j < len(type_keys) and type_keys[j] < (page, y - 5):
+            j += 1
+        if j < len(type_keys) and type_keys[j] <= (page, y + 5):
+            type_at[(page, y)] = types_by_y[type_keys[j]]
+
     matched = 0
-    for key, num in sorted(numbers_by_y.items(), key=lambda x: (x[0][0], x[1])):
-        page, y = key
-        for dy in range(-5, 6):
-            if (page, y + dy) in types_by_y:
-                qtype = types_by_y[(page, y + dy)]
-                print(f"  Q{num}: {qtype}")
-                matched += 1
-                break
+    # (page, num, y) tuples sort by page then number without a key function
+    for page, num, y in sorted((page, num, y) for (page, y), num in numbers_by_y.items()):
+        qtype = type_at.get((page, y))
+        if qtype is not None:
+            print(f"  Q{num}: {qtype}")
+            matched += 1
 
     print(f"\nMatched {matched}/{len(results['numbers'])} questions")
     return 0
@@ -381,7 +422,7 @@ def cmd_debug_drawings(args: argparse.Namespace) -> int:
         print(f"Error: File not found: {pdf_path}")
         return 1
 
-    doc = fitz.open(pdf_path)
+    doc = fitz.open(pdf_path, filetype="pdf")
     if args.page >= len(doc):
         print(f"Error: Page {args.page} out of range (0-{len(doc)-1})")
         return 1
@@ -456,8 +497,6 @@ def _check_pdf_worker(pdf_path_str: str) -> tuple[str, str | None]:
 
     pdf_path = Path(pdf_path_str)
     try:
-        if pdf_path.name in BLACKLIST:
-            return (pdf_path_str, "blacklisted")
         if is_ungraded_exam(pdf_path):
             return (pdf_path_str, "ungraded")
         if is_merged_exam(pdf_path):
@@ -473,39 +512,31 @@ def _parse_and_export_worker(args: tuple[str, str]) -> tuple[int, int, str | Non
     """Worker: Parse exam and export to YAML. Returns (questions, exported, error)."""
     import hashlib
 
-    import fitz
-
-    from .images import ImageExtractor
+    from .images import ImageExtractor, associate_images
 
     pdf_path_str, output_dir_str = args
     pdf_path = Path(pdf_path_str)
     output_dir = Path(output_dir_str)
 
     try:
-        # Detect course from path
-        from .constants import COURSE_CODES
-
-        course = "unknown"
-        for part in pdf_path.parts:
-            if part in COURSE_CODES:
-                course = part
-                break
+        course = _detect_course(pdf_path)
 
         parser = DISAParser(pdf_path, course)
         result = parser.parse()
-        parser.close()
 
         if not result.questions:
+            parser.close()
             return (0, 0, None)
 
         # Generate exam ID parts
         course_code = COURSE_CODES.get(course, course[:3])
-        date_match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})', result.metadata.date)
+        date_match = DATE_PATTERN.search(result.metadata.date)
         if date_match:
             yymm = date_match.group(3)[2:] + date_match.group(2)
         else:
             yymm = "0000"
-        file_hash = hashlib.md5(pdf_path.name.encode()).hexdigest()[:4]
+        # First 2 digest bytes == hexdigest()[:4]; keeps existing exam IDs stable
+        file_hash = hashlib.md5(pdf_path.name.encode(), usedforsecurity=False).digest()[:2].hex()
         exam_id = f"{course_code}_{yymm}_{file_hash}"
 
         # Create hierarchical output directory: course/yymm-hash/
@@ -516,57 +547,27 @@ def _parse_and_export_worker(args: tuple[str, str]) -> tuple[int, int, str | Non
         images_dir = exam_dir / "images"
         images_dir.mkdir(exist_ok=True)
 
-        extractor = ImageExtractor(pdf_path)
-        all_images = extractor.extract_all_images()
-        papers = extractor.extract_annotatable_papers()
-
-        # Build question ranges for image association
-        doc = fitz.open(pdf_path)
-        question_images: dict[int, list] = defaultdict(list)
-        question_papers: dict[int, Any] = {}
-
-        # Map pages to questions with y-ranges
-        q_ranges = []
-        for i, q in enumerate(result.questions):
-            y_start = q.y_position
-            if i + 1 < len(result.questions):
-                next_q = result.questions[i + 1]
-                if next_q.page_num == q.page_num:
-                    y_end = next_q.y_position
-                else:
-                    y_end = doc[q.page_num].rect.height
-            else:
-                y_end = doc[q.page_num].rect.height if q.page_num < len(doc) else 1000
-            q_ranges.append((q.page_num, y_start, y_end, q.number))
-
-        # Associate images with questions based on position
-        for img in all_images:
-            img_y = img.bbox[1]
-            img_page = img.page_num
-
-            # Skip tiny images (icons, bullets)
-            if img.is_tiny():
-                continue
-
-            # Check if full-page (annotatable paper)
-            if img_page < len(doc):
-                page_rect = doc[img_page].rect
-                if img.is_full_page(page_rect.width, page_rect.height):
-                    # Find which question owns this page
-                    for page, y_start, y_end, q_num in q_ranges:
-                        if page == img_page:
-                            question_papers[q_num] = img
-                            break
-                    continue
-
-            # Find which question this image belongs to
-            for page, y_start, y_end, q_num in q_ranges:
-                if page == img_page and y_start - 30 <= img_y < y_end:
-                    question_images[q_num].append(img)
-                    break
-
-        doc.close()
+        # Reuse the parser's open document instead of reopening the PDF
+        extractor = ImageExtractor(pdf_path, doc=parser.doc)
+        question_images, question_papers = associate_images(
+            result.questions, extractor.extract_all_images(), parser.doc
+        )
         extractor.close()
+        parser.close()
+
+        # The exam block is identical in every question file; emit it once
+        exam_yaml = yaml.dump(
+            {
+                'exam': {
+                    'id': exam_id,
+                    'course': course_code,
+                    'date': result.metadata.date,
+                    'file': pdf_path.name,
+                },
+            },
+            Dumper=YamlDumper,
+            allow_unicode=True, default_flow_style=False, sort_keys=False,
+        )
 
         exported = 0
         for q in result.questions:
@@ -579,12 +580,6 @@ def _parse_and_export_worker(args: tuple[str, str]) -> tuple[int, int, str | Non
             yaml_path = exam_dir / yaml_filename
 
             data = {
-                'exam': {
-                    'id': exam_id,
-                    'course': course_code,
-                    'date': result.metadata.date,
-                    'file': pdf_path.name,
-                },
                 'q': {
                     'num': q.number,
                     'type': qtype,
@@ -647,7 +642,11 @@ def _parse_and_export_worker(args: tuple[str, str]) -> tuple[int, int, str | Non
                 ]
 
             with open(yaml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+                f.write(exam_yaml)
+                yaml.dump(
+                    data, f, Dumper=YamlDumper,
+                    allow_unicode=True, default_flow_style=False, sort_keys=False,
+                )
 
             exported += 1
 
@@ -657,6 +656,22 @@ def _parse_and_export_worker(args: tuple[str, str]) -> tuple[int, int, str | Non
         return (0, 0, str(e))
 
 
+def _find_pdfs(directory: Path, recursive: bool) -> Iterator[str]:
+    """Yield PDF paths under directory as strings, ready for pickling."""
+    import os
+
+    if recursive:
+        for dirpath, _, filenames in os.walk(directory):
+            for filename in filenames:
+                if filename.endswith(".pdf"):
+                    yield os.path.join(dirpath, filename)
+    else:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    yield entry.path
+
+
 def cmd_process(args: argparse.Namespace) -> int:
     """Scan directory for DISA exams, parse them, and write YAML output."""
     import os
@@ -677,12 +692,11 @@ def cmd_process(args: argparse.Namespace) -> int:
     print(f"  Recursive: {recursive}")
     print(f"  Workers: {num_workers}")
 
-    # Phase 1: Find all PDFs
-    pattern = "**/*.pdf" if recursive else "*.pdf"
-    all_pdfs = list(directory.glob(pattern))
-    print(f"  Found {len(all_pdfs)} PDF files")
+    # Phase 1: Find all PDFs (as strings for pickling)
+    pdf_paths_str = list(_find_pdfs(directory, recursive))
+    print(f"  Found {len(pdf_paths_str)} PDF files")
 
-    if not all_pdfs:
+    if not pdf_paths_str:
         print("No PDF files found.")
         return 0
 
@@ -692,13 +706,18 @@ def cmd_process(args: argparse.Namespace) -> int:
     valid_exams: list[Path] = []
     skipped: dict[str, int] = defaultdict(int)
 
-    # Convert to strings for pickling
-    pdf_paths_str = [str(p) for p in all_pdfs]
+    # Blacklisted files are known by name alone; keep them out of the pool
+    to_check: list[str] = []
+    for path_str in pdf_paths_str:
+        if os.path.basename(path_str) in BLACKLIST:
+            skipped["blacklisted"] += 1
+        else:
+            to_check.append(path_str)
 
+    # Most checks are cheap rejections, so batch them to amortize the IPC
     with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        futures = {executor.submit(_check_pdf_worker, p): p for p in pdf_paths_str}
-        for future in as_completed(futures):
-            path_str, reason = future.result()
+        checks = executor.map(_check_pdf_worker, to_check, chunksize=16)
+        for path_str, reason in checks:
             if reason is None:
                 valid_exams.append(Path(path_str))
             else:
@@ -753,9 +772,7 @@ def cmd_process(args: argparse.Namespace) -> int:
 
 def cmd_dump(args: argparse.Namespace) -> int:
     """Dump PDF pages to JSON fixture for testing."""
-    import json
-
-    from .fixture import FixtureEncoder, dump_pages
+    from .fixture import dump_pages, dumps_fixture
 
     pdf_path = Path(args.file)
     if not pdf_path.exists():
@@ -766,7 +783,7 @@ def cmd_dump(args: argparse.Namespace) -> int:
     fixture = dump_pages(pdf_path, pages)
 
     if args.output:
-        Path(args.output).write_text(json.dumps(fixture, indent=2, cls=FixtureEncoder))
+        Path(args.output).write_bytes(dumps_fixture(fixture))
         print(f"Dumped to {args.output}")
         print(f"  Source: {fixture['source']}")
         print(f"  Pages: {len(fixture['pages'])}")
@@ -775,16 +792,21 @@ def cmd_dump(args: argparse.Namespace) -> int:
             drawings = len(fixture["pages"][p]["drawings"])
             print(f"    Page {p}: {blocks} blocks, {drawings} drawings")
     else:
-        import json
-
-        print(json.dumps(fixture, indent=2, cls=FixtureEncoder))
+        data = dumps_fixture(fixture) + b"\n"
+        # dumps_fixture returns UTF-8 bytes; skip the decode/encode round trip
+        # unless stdout has been replaced by a text-only stream
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(data)
+        else:
+            sys.stdout.write(data.decode("utf-8"))
 
     return 0
 
 
 def cmd_images(args: argparse.Namespace) -> int:
     """Extract images from DISA exam PDFs."""
-    from .images import ImageExtractor
+    from .images import ImageExtractor, associate_images
     from .models import ImageRef
 
     pdf_path = Path(args.file)
@@ -804,13 +826,13 @@ def cmd_images(args: argparse.Namespace) -> int:
     course = "unknown"
     parser = DISAParser(pdf_path, course)
     exam = parser.parse()
-    parser.close()
 
     print(f"  Found {len(exam.questions)} questions")
 
-    # Extract images
-    extractor = ImageExtractor(pdf_path)
-    all_images = extractor.extract_all_images()
+    # Extract images, reusing the parser's open document
+    doc = parser.doc
+    extractor = ImageExtractor(pdf_path, doc=doc)
+    all_images = extractor.extract_all_images(workers=args.workers)
     print(f"  Found {len(all_images)} images total")
 
     # Find annotatable papers
@@ -818,49 +840,9 @@ def cmd_images(args: argparse.Namespace) -> int:
     print(f"  Found {len(papers)} annotatable papers")
 
     # Associate images with questions based on position
-    doc = fitz.open(pdf_path)
-    question_images: dict[int, list] = defaultdict(list)
-    question_papers: dict[int, Any] = {}
-
-    # Build question ranges: (page, y_start, y_end, q_num)
-    q_ranges: list[tuple[int, float, float, int]] = []
-    for i, q in enumerate(exam.questions):
-        if q.page_num < 0:
-            continue
-        y_start = q.y_position
-        # Find y_end from next question on same page, or page bottom
-        y_end = doc[q.page_num].rect.height
-        for j in range(i + 1, len(exam.questions)):
-            next_q = exam.questions[j]
-            if next_q.page_num == q.page_num:
-                y_end = next_q.y_position
-                break
-            elif next_q.page_num > q.page_num:
-                break
-        q_ranges.append((q.page_num, y_start, y_end, q.number))
-
-    # Associate images with questions
-    for img in all_images:
-        img_y = img.bbox[1]
-        img_page = img.page_num
-
-        # Check if it's an annotatable paper
-        page_rect = doc[img_page].rect
-        if img.is_full_page(page_rect.width, page_rect.height):
-            # Find which question this paper belongs to
-            for page, y_start, y_end, q_num in q_ranges:
-                if page == img_page:
-                    question_papers[q_num] = img
-                    break
-            continue
+    question_images, question_papers = associate_images(exam.questions, all_images, doc)
 
-        # Find which question this image belongs to
-        for page, y_start, y_end, q_num in q_ranges:
-            if page == img_page and y_start - 30 <= img_y < y_end:
-                question_images[q_num].append(img)
-                break
-
-    doc.close()
+    parser.close()
 
     # Save images
     total_saved = 0
@@ -949,11 +931,13 @@ Examples:
     p_process.add_argument("-w", "--workers", type=int, help="Number of worker processes (default: CPU count)")
     p_process.add_argument("--no-recursive", action="store_true", help="Don't scan subdirectories")
     p_process.add_argument("-v", "--verbose", action="store_true", help="Show detailed error messages")
+    p_process.set_defaults(func=cmd_process)
 
     # Parse
     p_parse = subparsers.add_parser("parse", help="Parse a single exam")
     p_parse.add_argument("file", help="Path to PDF file")
     p_parse.add_argument("--limit", type=int, help="Limit questions shown")
+    p_parse.set_defaults(func=cmd_parse)
 
     # Validate
     p_validate = subparsers.add_parser("validate", help="Run parser validation")
@@ -965,6 +949,8 @@ Examples:
     )
     p_validate.add_argument("--csv", help="Path to exam CSV file")
     p_validate.add_argument("--scraped-dir", help="Path to scraped data directory")
+    p_validate.add_argument("-w", "--workers", type=int, help="Number of worker processes (default: CPU count)")
+    p_validate.set_defaults(func=cmd_validate)
 
     # Debug
     p_debug = subparsers.add_parser("debug", help="Debug PDF structure")
@@ -974,14 +960,17 @@ Examples:
     p_blocks.add_argument("file", help="Path to PDF file")
     p_blocks.add_argument("page", type=int, help="Page number (0-indexed)")
     p_blocks.add_argument("-v", "--verbose", action="store_true", help="Show font and color info")
+    p_blocks.set_defaults(func=cmd_debug_blocks)
 
     p_toc = debug_sub.add_parser("toc", help="Debug TOC structure")
     p_toc.add_argument("file", help="Path to PDF file")
+    p_toc.set_defaults(func=cmd_debug_toc)
 
     p_drawings = debug_sub.add_parser("drawings", help="Debug drawings/colors")
     p_drawings.add_argument("file", help="Path to PDF file")
     p_drawings.add_argument("page", type=int, help="Page number (0-indexed)")
     p_drawings.add_argument("-v", "--verbose", action="store_true", help="Show all colored drawings")
+    p_drawings.set_defaults(func=cmd_debug_drawings)
 
     # Dump (PDF to JSON)
     p_dump = subparsers.add_parser("dump", help="Dump PDF pages to JSON for testing")
@@ -989,41 +978,25 @@ Examples:
     p_dump.add_argument("pages", nargs="*", type=int, help="Page numbers (0-indexed)")
     p_dump.add_argument("--all", action="store_true", help="Dump all pages")
     p_dump.add_argument("-o", "--output", help="Output JSON file (default: stdout)")
+    p_dump.set_defaults(func=cmd_dump)
 
     # Images
     p_images = subparsers.add_parser("images", help="Extract images from DISA exam PDFs")
     p_images.add_argument("file", help="Path to PDF file")
     p_images.add_argument("-o", "--output", help="Output directory for images (default: images/)")
     p_images.add_argument("-v", "--verbose", action="store_true", help="Show per-question breakdown")
+    p_images.add_argument("-w", "--workers", type=int, default=1, help="Number of worker processes for image extraction (default: 1)")
+    p_images.set_defaults(func=cmd_images)
 
     args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
+    func = getattr(args, "func", None)
+    if func is None:
+        # No command, or "debug" without a debug command
+        (p_debug if args.command == "debug" else parser).print_help()
         return 1
 
-    if args.command == "process":
-        return cmd_process(args)
-    elif args.command == "parse":
-        return cmd_parse(args)
-    elif args.command == "validate":
-        return cmd_validate(args)
-    elif args.command == "debug":
-        if args.debug_cmd == "blocks":
-            return cmd_debug_blocks(args)
-        elif args.debug_cmd == "toc":
-            return cmd_debug_toc(args)
-        elif args.debug_cmd == "drawings":
-            return cmd_debug_drawings(args)
-        else:
-            p_debug.print_help()
-            return 1
-    elif args.command == "dump":
-        return cmd_dump(args)
-    elif args.command == "images":
-        return cmd_images(args)
-
-    return 0
+    return func(args)
 
 
 if __name__ == "__main__":
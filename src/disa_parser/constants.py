@@ -38,12 +38,12 @@ COURSE_CODES: dict[str, str] = {
 }
 
 # Blacklisted files (merged/duplicate exams that don't add value)
-BLACKLIST: set[str] = {
+BLACKLIST: frozenset[str] = frozenset({
     "YZf9yLAXGlkpSbQ9GKlt_Tentor_med_svar.pdf",
     "7I3UGkJgSQcYE18EYYMR_Tentor_med_svar.pdf",
     "LCjrBjJiquEd9Vv2c24A_Tentor_med_svar.pdf",
     "tUEMcmS1CrYLJ1LWhpqG_Tentor_med_svar_.pdf",
-}
+})
 
 # Question types recognized by the parser
 QUESTION_TYPES: list[str] = [
@@ -67,6 +67,9 @@ QUESTION_TYPES: list[str] = [
     "Sifferfält",
 ]
 
+# Set view of QUESTION_TYPES for the per-block membership checks
+QUESTION_TYPES_SET: frozenset[str] = frozenset(QUESTION_TYPES)
+
 # PDF format detection thresholds
 FORMATS: dict[str, dict[str, int]] = {
     "TENTAMEN": {"X_QUESTION_NUMBER": 45, "X_OPTION": 70},
@@ -75,14 +78,20 @@ FORMATS: dict[str, dict[str, int]] = {
 }
 
 # Answer markers
-CORRECT_MARKERS: list[str] = ["✓", "✔", "\u2713", "\u2714", "●"]
-INCORRECT_MARKERS: list[str] = ["✗", "✘", "\u2717", "\u2718", "○"]
+# Single characters, so "any marker in text" is a set isdisjoint() check
+CORRECT_MARKERS: frozenset[str] = frozenset({"✓", "✔", "●"})
+INCORRECT_MARKERS: frozenset[str] = frozenset({"✗", "✘", "○"})
+ALL_MARKERS: frozenset[str] = CORRECT_MARKERS | INCORRECT_MARKERS
 
 # Color thresholds for answer detection
 GREEN_THRESHOLD: tuple[float, float, float] = (0.3, 0.4, 0.2)
 
 # Regex patterns
 POINTS_PATTERN: re.Pattern = re.compile(r"Totalpoäng:\s*(\d+(?:[.,]\d+)?)")
+POINTS_SEARCH = POINTS_PATTERN.search
+
+# Exam date as DD.MM.YYYY, as printed in the metadata header
+DATE_PATTERN: re.Pattern = re.compile(r"(\d{2})\.(\d{2})\.(\d{4})")
 
 # Swedish number words to digits
 SWEDISH_NUMBERS: dict[str, int] = {
@@ -104,6 +113,7 @@ EXPECTED_ANSWERS_PATTERN: re.Pattern = re.compile(
     r"|(\d+)\s*(?:svar|alternativ)",
     re.IGNORECASE
 )
+EXPECTED_ANSWERS_SEARCH = EXPECTED_ANSWERS_PATTERN.search
 
 # Pattern for "one or more" answers (count unknown/variable)
 # Matches: "Välj ett eller flera alternativ"
@@ -111,3 +121,4 @@ MULTIPLE_ANSWERS_PATTERN: re.Pattern = re.compile(
     r"välj\s+ett\s+eller\s+flera",
     re.IGNORECASE
 )
+MULTIPLE_ANSWERS_SEARCH = MULTIPLE_ANSWERS_PATTERN.search
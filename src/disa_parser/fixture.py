@@ -18,6 +18,7 @@ Usage:
 from __future__ import annotations
 
 import base64
+import dataclasses
 import gzip
 import json
 from pathlib import Path
@@ -25,21 +26,42 @@ from typing import TYPE_CHECKING, Any
 
 import fitz
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+# Drawing entries that PyMuPDF returns as tuples but JSON stores as lists
+_DRAWING_TUPLE_KEYS = ("rect", "fill", "color")
+
+
+def fixture_encoder(obj: Any) -> Any:
+    """JSON encoder hook for PyMuPDF types.
+
+    Usable as ``default=`` for both ``json.dumps`` and ``orjson.dumps``.
+    Raises TypeError for unsupported objects.
+    """
+    if isinstance(obj, bytes):
+        return {"__bytes__": base64.b64encode(obj).decode("ascii")}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # orjson serializes dataclasses natively; mirror that for json
+        return dataclasses.asdict(obj)
+    if isinstance(obj, fitz.Rect):
+        return tuple(obj)
+    if isinstance(obj, fitz.Point):
+        return tuple(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class FixtureEncoder(json.JSONEncoder):
     """JSON encoder that handles PyMuPDF types."""
 
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, bytes):
-            return {"__bytes__": base64.b64encode(obj).decode("ascii")}
-        if isinstance(obj, fitz.Rect):
-            return tuple(obj)
-        if isinstance(obj, fitz.Point):
-            return tuple(obj)
-        return super().default(obj)
+        return fixture_encoder(obj)
 
 
 def fixture_decoder(obj: dict) -> Any:
@@ -49,10 +71,87 @@ def fixture_decoder(obj: dict) -> Any:
     return obj
 
 
-def dump_page(page: fitz.Page) -> dict:
-    """Dump a single page's PyMuPDF structures."""
+def _decode_bytes_anywhere(obj: Any) -> Any:
+    """Decode ``__bytes__`` markers at any depth, like ``fixture_decoder``."""
+    if isinstance(obj, dict):
+        if "__bytes__" in obj:
+            return fixture_decoder(obj)
+        return {key: _decode_bytes_anywhere(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_decode_bytes_anywhere(value) for value in obj]
+    return obj
+
+
+def _restore_fixture(fixture: Any, markers: int) -> Any:
+    """Decode the ``markers`` ``__bytes__`` markers of a parsed fixture.
+
+    Dumped fixtures only carry binary payloads in image blocks of
+    ``text_dict``, so those are decoded in place without walking every node.
+    If that does not account for all markers (a hand-written fixture, say),
+    the whole tree is walked instead.
+    """
+    if not markers:
+        return fixture
+    decoded = 0
+    if isinstance(fixture, dict):
+        for page in fixture.get("pages", {}).values():
+            for block in page.get("text_dict", {}).get("blocks", []):
+                if block.get("type") == 0:
+                    continue
+                for key, value in block.items():
+                    if isinstance(value, dict) and "__bytes__" in value:
+                        block[key] = fixture_decoder(value)
+                        decoded += 1
+    if decoded < markers:
+        return _decode_bytes_anywhere(fixture)
+    return fixture
+
+
+def _parse_fixture_json(data: str | bytes) -> Any:
+    """Parse fixture JSON, using orjson when it is installed.
+
+    Both backends decode ``__bytes__`` markers the same way, through
+    ``_restore_fixture``.
+    """
+    # The quoted key cannot occur inside a JSON string, where quotes are
+    # escaped, so this counts exactly the markers to decode
+    marker = '"__bytes__"'
+    markers = data.count(marker if isinstance(data, str) else marker.encode())
+    if orjson is not None:
+        return _restore_fixture(orjson.loads(data), markers)
+    return _restore_fixture(json.loads(data), markers)
+
+
+def dumps_fixture(fixture: dict, pretty: bool = True) -> bytes:
+    """Serialize a fixture to UTF-8 JSON, indented unless ``pretty=False``."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else None
+        return orjson.dumps(fixture, default=fixture_encoder, option=option)
+    # Write å/ä/ö as UTF-8 like orjson does, not as \uXXXX escapes
+    if pretty:
+        return json.dumps(
+            fixture, indent=2, ensure_ascii=False, cls=FixtureEncoder
+        ).encode("utf-8")
+    return json.dumps(
+        fixture, separators=(",", ":"), ensure_ascii=False, cls=FixtureEncoder
+    ).encode("utf-8")
+
+
+def dump_page(page: fitz.Page, images: bool = True) -> dict:
+    """Dump a single page's PyMuPDF structures.
+
+    With ``images=False`` image blocks are left out of ``text_dict``. The
+    parser only reads text blocks, and skipping the image payloads saves
+    both extraction and serialization time.
+    """
+    if images:
+        text_dict = page.get_text("dict")
+    else:
+        text_dict = page.get_text(
+            "dict", flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+        )
     return {
-        "text_dict": page.get_text("dict"),
+        "text_dict": text_dict,
         "drawings": page.get_drawings(),
     }
 
@@ -91,43 +190,52 @@ def save_fixture(
 ) -> dict:
     """Dump pages and save to JSON file."""
     fixture = dump_pages(pdf_path, pages)
-    Path(output_path).write_text(json.dumps(fixture, indent=2, cls=FixtureEncoder))
+    Path(output_path).write_bytes(dumps_fixture(fixture))
     return fixture
 
 
 class MockPage:
     """Mock PyMuPDF page loaded from fixture data."""
 
-    def __init__(self, page_data: dict) -> None:
+    def __init__(self, page_data: dict, number: int = 0) -> None:
+        # Page index, like fitz.Page.number
+        self.number = number
         self._text_dict = page_data.get("text_dict", {"blocks": []})
         self._drawings = page_data.get("drawings", [])
+        # Drawing tuples are restored on the first get_drawings() call
+        self._drawings_restored = False
+        self._plain_text: str | None = None
 
-        # Convert drawing tuples back from lists (JSON serialization)
-        for d in self._drawings:
-            if "rect" in d and isinstance(d["rect"], list):
-                d["rect"] = tuple(d["rect"])
-            if "fill" in d and isinstance(d["fill"], list):
-                d["fill"] = tuple(d["fill"])
-            if "color" in d and isinstance(d["color"], list):
-                d["color"] = tuple(d["color"])
-
-    def get_text(self, mode: str = "text") -> Any:
+    def get_text(self, mode: str = "text", flags: int | None = None) -> Any:
         """Mock get_text - returns stored dict or extracts plain text."""
         if mode == "dict":
+            if flags is not None and not flags & fitz.TEXT_PRESERVE_IMAGES:
+                blocks = [b for b in self._text_dict.get("blocks", []) if b.get("type") == 0]
+                return {**self._text_dict, "blocks": blocks}
             return self._text_dict
 
-        # Extract plain text from dict
-        lines = []
-        for block in self._text_dict.get("blocks", []):
-            if block.get("type") != 0:
-                continue
-            for line in block.get("lines", []):
-                text = "".join(span.get("text", "") for span in line.get("spans", []))
-                lines.append(text)
-        return "\n".join(lines)
+        # Extract plain text from dict, once; the stored dict never changes
+        if self._plain_text is None:
+            lines = []
+            for block in self._text_dict.get("blocks", []):
+                if block.get("type") != 0:
+                    continue
+                for line in block.get("lines", []):
+                    text = "".join(span.get("text", "") for span in line.get("spans", []))
+                    lines.append(text)
+            self._plain_text = "\n".join(lines)
+        return self._plain_text
 
     def get_drawings(self) -> list[dict]:
         """Mock get_drawings - returns stored drawings."""
+        if not self._drawings_restored:
+            # Convert drawing tuples back from lists (JSON serialization)
+            for d in self._drawings:
+                for key in _DRAWING_TUPLE_KEYS:
+                    value = d.get(key)
+                    if isinstance(value, list):
+                        d[key] = tuple(value)
+            self._drawings_restored = True
         return self._drawings
 
 
@@ -136,19 +244,23 @@ class MockDocument:
 
     def __init__(self, fixture: dict) -> None:
         self._fixture = fixture
+        self._raw_pages: dict[str, dict] = fixture.get("pages", {})
+        # Built on first access; most callers only touch a few pages
         self._pages: dict[int, MockPage] = {}
 
-        for page_num_str, page_data in fixture.get("pages", {}).items():
-            self._pages[int(page_num_str)] = MockPage(page_data)
-
     def __len__(self) -> int:
         return self._fixture.get("page_count", 0)
 
     def __getitem__(self, page_num: int) -> MockPage:
-        if page_num in self._pages:
-            return self._pages[page_num]
-        # Return empty page for pages not in fixture
-        return MockPage({"text_dict": {"blocks": []}, "drawings": []})
+        page = self._pages.get(page_num)
+        if page is not None:
+            return page
+        page_data = self._raw_pages.get(str(page_num))
+        if page_data is None:
+            # Return empty page for pages not in fixture
+            return MockPage({"text_dict": {"blocks": []}, "drawings": []}, page_num)
+        page = self._pages[page_num] = MockPage(page_data, page_num)
+        return page
 
     def close(self) -> None:
         pass
@@ -157,9 +269,9 @@ class MockDocument:
 def _read_fixture_file(path: Path) -> dict:
     """Read a fixture file, handling gzip compression."""
     if path.suffix == ".gz":
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            return json.load(f, object_hook=fixture_decoder)
-    return json.loads(path.read_text(), object_hook=fixture_decoder)
+        with gzip.open(path, "rb") as f:
+            return _parse_fixture_json(f.read())
+    return _parse_fixture_json(path.read_bytes())
 
 
 def load_fixture(fixture: dict | str | Path) -> MockDocument:
@@ -183,7 +295,7 @@ def load_fixture(fixture: dict | str | Path) -> MockDocument:
         # Check if it looks like a JSON object/array (starts with { or [)
         stripped = fixture.strip()
         if stripped.startswith("{") or stripped.startswith("["):
-            fixture = json.loads(fixture, object_hook=fixture_decoder)
+            fixture = _parse_fixture_json(fixture)
             return MockDocument(fixture)
 
         # Try as file path
@@ -193,6 +305,6 @@ def load_fixture(fixture: dict | str | Path) -> MockDocument:
             return MockDocument(fixture)
 
         # Fall back to parsing as JSON
-        fixture = json.loads(fixture, object_hook=fixture_decoder)
+        fixture = _parse_fixture_json(fixture)
 
     return MockDocument(fixture)
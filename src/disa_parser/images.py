@@ -10,6 +10,8 @@ Handles:
 from __future__ import annotations
 
 import hashlib
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -20,7 +22,7 @@ if TYPE_CHECKING:
     from .models import Question
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedImage:
     """An image extracted from a PDF."""
 
@@ -35,7 +37,7 @@ class ExtractedImage:
 
     def __post_init__(self):
         if not self.hash:
-            self.hash = hashlib.md5(self.data).hexdigest()[:12]
+            self.hash = hashlib.blake2b(self.data, digest_size=6).hexdigest()
 
     @property
     def area(self) -> float:
@@ -51,10 +53,9 @@ class ExtractedImage:
 
     def is_full_page(self, page_width: float, page_height: float) -> bool:
         """Check if image covers most of the page (annotatable paper)."""
-        img_width = self.bbox[2] - self.bbox[0]
-        img_height = self.bbox[3] - self.bbox[1]
+        x0, y0, x1, y1 = self.bbox
         # Image covers >70% of page dimensions
-        return (img_width / page_width > 0.7) and (img_height / page_height > 0.7)
+        return x1 - x0 > 0.7 * page_width and y1 - y0 > 0.7 * page_height
 
     def is_tiny(self) -> bool:
         """Check if image is too small to be meaningful (icons, bullets)."""
@@ -67,7 +68,7 @@ class ExtractedImage:
         return path
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionImages:
     """Images associated with a question."""
 
@@ -89,40 +90,77 @@ class ImageExtractor:
     # Threshold for considering an image as full-page annotatable paper
     PAGE_COVERAGE_THRESHOLD = 0.6
 
-    def __init__(self, pdf_path: Path | str):
+    def __init__(self, pdf_path: Path | str, doc: fitz.Document | None = None):
+        """Open pdf_path, or borrow an already open doc for it.
+
+        A borrowed document is left open by close(); its owner closes it.
+        """
         self.pdf_path = Path(pdf_path)
-        self.doc = fitz.open(pdf_path)
-        self._image_cache: dict[int, ExtractedImage] = {}  # xref -> image
+        self._owns_doc = doc is None
+        self.doc = fitz.open(pdf_path) if doc is None else doc
+        # xref -> image, or None for xrefs that were skipped (tiny or broken)
+        self._image_cache: dict[int, ExtractedImage | None] = {}
+        # page_num -> images placed on it; every public method walks pages
+        self._page_images: dict[int, list[ExtractedImage]] = {}
+        # page_num -> (image tops sorted, matching indices into _page_images)
+        self._page_tops: dict[int, tuple[list[float], list[int]]] = {}
 
     def close(self):
-        self.doc.close()
+        if self._owns_doc:
+            self.doc.close()
 
-    def extract_all_images(self) -> list[ExtractedImage]:
+    def extract_all_images(self, workers: int = 1) -> list[ExtractedImage]:
         """Extract all meaningful images from the PDF.
 
         Note: Same image appearing on different pages is kept (not deduplicated)
         since each occurrence may belong to a different question.
+
+        Args:
+            workers: Number of processes to split the pages across. Each
+                process opens its own copy of the PDF, so this only pays off
+                for long exams with many images.
         """
-        images = []
-        # Track (hash, page) pairs to dedupe only within same page
-        seen: set[tuple[str, int]] = set()
+        page_count = len(self.doc)
+        workers = min(workers, page_count)
+        if workers <= 1:
+            return self._extract_page_range(0, page_count)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        # One contiguous page range per worker keeps the results in page order
+        step = -(-page_count // workers)
+        jobs = [
+            (str(self.pdf_path), start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        images: list[ExtractedImage] = []
+        with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+            for chunk in executor.map(_extract_pages_worker, jobs):
+                images.extend(chunk)
+        return images
 
-        for page_num in range(len(self.doc)):
-            page = self.doc[page_num]
-            page_images = self._extract_page_images(page, page_num)
+    def _extract_page_range(self, start: int, stop: int) -> list[ExtractedImage]:
+        """Extract images from pages start..stop-1, deduplicated per page."""
+        images: list[ExtractedImage] = []
+        append = images.append
 
-            for img in page_images:
-                # Skip duplicates only on the same page
-                key = (img.hash, img.page_num)
-                if key in seen:
-                    continue
-                seen.add(key)
-                images.append(img)
+        for page_num in range(start, stop):
+            page = self.doc[page_num]
+            # Skip duplicates only on the same page
+            seen: set[str] = set()
+            for img in self._extract_page_images(page, page_num):
+                if img.hash not in seen:
+                    seen.add(img.hash)
+                    append(img)
 
         return images
 
     def _extract_page_images(self, page: fitz.Page, page_num: int) -> list[ExtractedImage]:
-        """Extract images from a single page."""
+        """Extract images from a single page, once per page."""
+        cached_images = self._page_images.get(page_num)
+        if cached_images is not None:
+            return cached_images
+
         images = []
 
         # Get all images on this page
@@ -134,6 +172,8 @@ class ImageExtractor:
             # Check cache for image data (but need fresh bbox for this page)
             if xref in self._image_cache:
                 cached = self._image_cache[xref]
+                if cached is None:
+                    continue
                 # Get bbox for this specific page placement
                 bbox = self._get_image_bbox(page, xref, img_info)
                 # Create new instance with correct page_num and bbox
@@ -150,10 +190,17 @@ class ImageExtractor:
                 images.append(img)
                 continue
 
+            # The xref table already has the pixel size, so tiny icons and
+            # bullets are skipped without decompressing them
+            if img_info[2] < self.MIN_WIDTH or img_info[3] < self.MIN_HEIGHT:
+                self._image_cache[xref] = None
+                continue
+
             try:
                 # Extract the image
                 base_image = self.doc.extract_image(xref)
                 if not base_image:
+                    self._image_cache[xref] = None
                     continue
 
                 width = base_image["width"]
@@ -161,6 +208,7 @@ class ImageExtractor:
 
                 # Skip tiny images
                 if width < self.MIN_WIDTH or height < self.MIN_HEIGHT:
+                    self._image_cache[xref] = None
                     continue
 
                 # Determine image format
@@ -190,8 +238,10 @@ class ImageExtractor:
 
             except Exception:
                 # Skip problematic images
+                self._image_cache[xref] = None
                 continue
 
+        self._page_images[page_num] = images
         return images
 
     def _get_image_bbox(
@@ -246,22 +296,21 @@ class ImageExtractor:
         page_images = self._extract_page_images(page, question_page)
         page_rect = page.rect
 
-        for img in page_images:
-            img_y = img.bbox[1]  # Top of image
-            img_bottom = img.bbox[3]
-
-            # Check if image is in question's y-range
-            in_range = img_y >= question_y - 20  # Allow some margin above
-
-            if next_question_y is not None:
-                in_range = in_range and img_y < next_question_y
-            else:
-                # Last question on page - image should be below question start
-                in_range = in_range and img_y < page_height
-
-            if not in_range:
-                continue
-
+        tops = self._page_tops.get(question_page)
+        if tops is None:
+            by_top = sorted((img.bbox[1], i) for i, img in enumerate(page_images))
+            tops = ([top for top, _ in by_top], [i for _, i in by_top])
+            self._page_tops[question_page] = tops
+        y_tops, order = tops
+
+        # Image tops in [question_y - 20, end); allow some margin above
+        y_limit = next_question_y if next_question_y is not None else page_height
+        lo = bisect_left(y_tops, question_y - 20)
+        hi = bisect_left(y_tops, y_limit, lo)
+
+        # Keep page order so numbering and the chosen paper stay the same
+        for i in sorted(order[lo:hi]):
+            img = page_images[i]
             # Check if this is a full-page annotatable paper
             if img.is_full_page(page_rect.width, page_rect.height):
                 result.annotatable_paper = img
@@ -330,6 +379,124 @@ class ImageExtractor:
         return saved
 
 
+def _extract_pages_worker(args: tuple) -> list[ExtractedImage]:
+    """Worker: extract images from a page range of one PDF.
+
+    Documents can't be pickled, so each worker opens the PDF itself.
+    Returns the range's images in page order.
+    """
+    pdf_path, start, stop = args
+    extractor = ImageExtractor(pdf_path)
+    try:
+        return extractor._extract_page_range(start, stop)
+    finally:
+        extractor.close()
+
+
+class QuestionRanges:
+    """Per-page lookup from a y position to the question that covers it.
+
+    Built from (page, y_start, y_end, q_num) ranges. The ranges on a page
+    tile it top to bottom, so both y_starts and y_ends are sorted and a
+    lookup is a bisect instead of a scan over every question.
+    """
+
+    # Images may start slightly above the question text they belong to
+    SLACK = 30
+
+    def __init__(self, q_ranges: list[tuple[int, float, float, int]]) -> None:
+        by_page: dict[int, list[tuple[float, float, int]]] = defaultdict(list)
+        for page, y_start, y_end, q_num in q_ranges:
+            by_page[page].append((y_start, y_end, q_num))
+
+        self._pages: dict[int, tuple[list[float], list[float], list[int]]] = {}
+        for page, ranges in by_page.items():
+            ranges.sort(key=lambda r: r[0])
+            self._pages[page] = (
+                [r[0] for r in ranges],
+                [r[1] for r in ranges],
+                [r[2] for r in ranges],
+            )
+
+    def question_at(self, page: int, y: float) -> int | None:
+        """Return the first question whose range contains y on page."""
+        entry = self._pages.get(page)
+        if entry is None:
+            return None
+        y_starts, y_ends, q_nums = entry
+        # First range that ends below y; earlier ones cannot contain it
+        i = bisect_right(y_ends, y)
+        if i < len(y_ends) and y_starts[i] - self.SLACK <= y:
+            return q_nums[i]
+        return None
+
+    def first_on_page(self, page: int) -> int | None:
+        """Return the topmost question on page."""
+        entry = self._pages.get(page)
+        return entry[2][0] if entry else None
+
+
+def associate_images(
+    questions: list[Question],
+    images: list[ExtractedImage],
+    doc: fitz.Document,
+) -> tuple[dict[int, list[ExtractedImage]], dict[int, ExtractedImage]]:
+    """Assign extracted images to the questions they appear under.
+
+    A question's range runs from its y position to the next question on the
+    same page, or to the page bottom. Full-page images become the
+    annotatable paper of the topmost question on their page; other images
+    go to the question whose range contains their top edge.
+
+    Args:
+        questions: Parsed questions, in document order
+        images: Images from ImageExtractor.extract_all_images()
+        doc: Open document the images were extracted from
+
+    Returns:
+        (question_images, question_papers), both keyed by question number
+    """
+    page_count = len(doc)
+
+    q_ranges: list[tuple[int, float, float, int]] = []
+    for i, q in enumerate(questions):
+        if q.page_num < 0:
+            continue
+        # Find y_end from next question on same page, or page bottom
+        y_end = doc[q.page_num].rect.height if q.page_num < page_count else 1000
+        for next_q in questions[i + 1:]:
+            if next_q.page_num == q.page_num:
+                y_end = next_q.y_position
+                break
+            elif next_q.page_num > q.page_num:
+                break
+        q_ranges.append((q.page_num, q.y_position, y_end, q.number))
+
+    ranges = QuestionRanges(q_ranges)
+    question_images: dict[int, list[ExtractedImage]] = defaultdict(list)
+    question_papers: dict[int, ExtractedImage] = {}
+
+    for img in images:
+        # Skip tiny images (icons, bullets)
+        if img.is_tiny():
+            continue
+
+        # Full-page images are annotatable papers
+        if img.page_num < page_count:
+            page_rect = doc[img.page_num].rect
+            if img.is_full_page(page_rect.width, page_rect.height):
+                q_num = ranges.first_on_page(img.page_num)
+                if q_num is not None:
+                    question_papers[q_num] = img
+                continue
+
+        q_num = ranges.question_at(img.page_num, img.bbox[1])
+        if q_num is not None:
+            question_images[q_num].append(img)
+
+    return question_images, question_papers
+
+
 def extract_images_from_exam(
     pdf_path: Path | str,
     output_dir: Path | str | None = None,
@@ -354,10 +521,9 @@ def extract_images_from_exam(
     # First parse the exam to get question positions
     parser = DISAParser(pdf_path, "unknown")
     exam = parser.parse()
-    parser.close()
 
-    # Extract images
-    extractor = ImageExtractor(pdf_path)
+    # Extract images, reusing the parser's open document
+    extractor = ImageExtractor(pdf_path, doc=parser.doc)
     results: dict[int, QuestionImages] = {}
 
     # Build question position map
@@ -382,15 +548,14 @@ def extract_images_from_exam(
         # (would need page-to-question mapping from parser)
         pass
 
-    extractor.close()
-
     # Optionally save images
     if output_dir:
         output_dir = Path(output_dir)
         for q_num, q_images in results.items():
             if q_images.has_images():
-                extractor_new = ImageExtractor(pdf_path)
-                extractor_new.save_question_images(q_images, output_dir, exam_id)
-                extractor_new.close()
+                extractor.save_question_images(q_images, output_dir, exam_id)
+
+    extractor.close()
+    parser.close()
 
     return results
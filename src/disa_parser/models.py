@@ -1,8 +1,7 @@
 """Data models for DISA exam parsing."""
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
 
 
 class QuestionType(str, Enum):
@@ -18,7 +17,7 @@ class QuestionType(str, Enum):
     UNKNOWN = "Okänd"
 
 
-@dataclass
+@dataclass(slots=True)
 class Option:
     """An answer option for multiple choice questions."""
 
@@ -26,7 +25,7 @@ class Option:
     is_correct: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageRef:
     """Reference to an extracted image."""
 
@@ -46,7 +45,7 @@ class ImageRef:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HotspotRegion:
     """A clickable region for hotspot questions."""
 
@@ -63,7 +62,7 @@ class HotspotRegion:
         return self.x <= px <= self.x + self.width and self.y <= py <= self.y + self.height
 
 
-@dataclass
+@dataclass(slots=True)
 class DropdownChoice:
     """A dropdown choice for Textalternativ questions."""
 
@@ -74,7 +73,7 @@ class DropdownChoice:
         return {"answer": self.answer, "options": self.options}
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """A parsed exam question."""
 
@@ -97,8 +96,12 @@ class Question:
     # Dropdown choices for Textalternativ questions (DSL format)
     choices: dict[str, DropdownChoice] = field(default_factory=dict)
 
-    def to_dict(self) -> dict:
-        """Convert question to dictionary format."""
+    def to_dict(self, compact: bool = False) -> dict:
+        """Convert question to dictionary format.
+
+        With compact=True options are written as [text, is_correct] pairs and
+        hotspot regions as [x, y, w, h] lists instead of dicts.
+        """
         d = {
             "number": self.number,
             "text": self.text,
@@ -109,39 +112,52 @@ class Question:
             d["category"] = self.category
         if self.expected_answers != 1:
             d["expected_answers"] = self.expected_answers
+        # Element dicts are built inline; keep them in sync with the
+        # DropdownChoice, ImageRef and HotspotRegion to_dict methods
         if self.options:
-            d["options"] = [{"text": o.text, "is_correct": o.is_correct} for o in self.options]
+            if compact:
+                d["options"] = [[o.text, o.is_correct] for o in self.options]
+            else:
+                d["options"] = [{"text": o.text, "is_correct": o.is_correct} for o in self.options]
         if self.choices:
-            d["choices"] = {k: v.to_dict() for k, v in self.choices.items()}
+            d["choices"] = {
+                k: {"answer": v.answer, "options": v.options} for k, v in self.choices.items()
+            }
         elif self.answer:
             d["answer"] = self.answer
         if self.images:
-            d["images"] = [img.to_dict() for img in self.images]
-        if self.hotspot_regions:
-            d["hotspot_regions"] = [r.to_dict() for r in self.hotspot_regions]
+            d["images"] = [
+                {
+                    "path": img.path,
+                    "width": img.width,
+                    "height": img.height,
+                    "type": img.image_type,
+                    "is_paper": img.is_annotatable_paper,
+                }
+                for img in self.images
+            ]
+        if self.hotspot_regions and compact:
+            d["hotspot_regions"] = [[r.x, r.y, r.width, r.height] for r in self.hotspot_regions]
+        elif self.hotspot_regions:
+            d["hotspot_regions"] = [
+                {"x": r.x, "y": r.y, "w": r.width, "h": r.height}
+                for r in self.hotspot_regions
+            ]
         return d
 
     def has_answer(self) -> bool:
         """Check if this question has answer data."""
-        if self.choices:
-            return True
-        if isinstance(self.answer, list):
-            if self.answer:
-                return True
-        elif self.answer:
-            return True
-        if self.correct_answer:
+        # answer is a str or a list; both are falsy when empty
+        if self.choices or self.answer or self.correct_answer:
             return True
-        if any(o.is_correct for o in self.options):
-            return True
-        return False
+        return any(o.is_correct for o in self.options)
 
     def has_images(self) -> bool:
         """Check if this question has associated images."""
         return len(self.images) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExamMetadata:
     """Metadata for a parsed exam."""
 
@@ -150,8 +166,17 @@ class ExamMetadata:
     date: str = ""
     is_graded: bool = False
 
+    def to_dict(self) -> dict:
+        """Convert metadata to dictionary format."""
+        return {
+            "course_code": self.course_code,
+            "exam_title": self.exam_title,
+            "date": self.date,
+            "is_graded": self.is_graded,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedExam:
     """A fully parsed exam with all questions."""
 
@@ -160,12 +185,12 @@ class ParsedExam:
     metadata: ExamMetadata
     questions: list[Question]
 
-    def to_dict(self) -> dict:
-        """Convert exam to dictionary format."""
+    def to_dict(self, compact: bool = False) -> dict:
+        """Convert exam to dictionary format, see Question.to_dict for compact."""
         return {
             "filename": self.filename,
             "course": self.course,
-            "metadata": asdict(self.metadata),
-            "questions": [q.to_dict() for q in self.questions],
+            "metadata": self.metadata.to_dict(),
+            "questions": [q.to_dict(compact) for q in self.questions],
             "total_questions": len(self.questions),
         }
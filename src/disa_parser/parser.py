@@ -3,20 +3,23 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import fitz
 
 from .constants import (
+    ALL_MARKERS,
     CORRECT_MARKERS,
-    EXPECTED_ANSWERS_PATTERN,
+    EXPECTED_ANSWERS_SEARCH,
     FORMATS,
     GREEN_THRESHOLD,
     INCORRECT_MARKERS,
-    MULTIPLE_ANSWERS_PATTERN,
-    POINTS_PATTERN,
-    QUESTION_TYPES,
+    MULTIPLE_ANSWERS_SEARCH,
+    POINTS_SEARCH,
+    QUESTION_TYPES_SET,
     SWEDISH_NUMBERS,
 )
 from .models import DropdownChoice, ExamMetadata, HotspotRegion, Option, ParsedExam, Question, QuestionType
@@ -24,6 +27,84 @@ from .models import DropdownChoice, ExamMetadata, HotspotRegion, Option, ParsedE
 if TYPE_CHECKING:
     from .fixture import MockDocument
 
+# get_text("dict") flags without image extraction, for code that only reads
+# text blocks; keeps image pixel data out of every cached text dict
+TEXT_DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Free-text question types, where a green checkmark marks the answer text
+_TXT_TYPES = frozenset({"Textfält", "Textområde", "Textfält i bild", "Sifferfält"})
+# Option texts of Sant/Falskt (true/false) questions
+_SANT_FALSKT = frozenset({"Sant", "Falskt"})
+
+# Metadata on the first page
+_COURSE_CODE_RE = re.compile(r"Kurskod\s+([A-Z]{2,5}\d{3})")
+_EXAM_TITLE_RE = re.compile(r"TENTAMEN\s*\n\s*(.+?)(?:\n|$)")
+_START_DATE_RE = re.compile(r"Starttid\s+(\d{2}\.\d{2}\.\d{4})")
+
+# Question numbers, question heads and page furniture
+_QUESTION_NUMBER_RE = re.compile(r"^\d{1,3}$")
+_QUESTION_LINE_RE = re.compile(r"^\d{1,3}\s+\w", re.MULTILINE)
+_QUESTION_HEAD_RE = re.compile(r"^(\d{1,3})(?:\s+(.*))?$")
+_QUESTION_HEAD_MERGED_RE = re.compile(r"^(\d{1,3})([A-Za-z].*)$")
+_PAGE_NUMBER_RE = re.compile(r"^\d+/\d+$")
+# Markers that indicate a question page (essay, MCQ, etc.)
+_QUESTION_PAGE_MARKER_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "Skriv in ditt svar",
+                "Totalpoäng:",
+                "Bifoga ritning",
+                "Välj ett alternativ",  # MCQ marker
+                "Välj ett eller flera",  # Multi-select MCQ marker
+            ],
+        )
+    )
+)
+_LPG_HEADER_RE = re.compile(r"^LPG\d+")
+_DIGITS_ONLY_RE = re.compile(r"^[\d\s]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Categories
+_CATEGORY_MARKER_RE = re.compile(r"^[A-Z]{2,3}\s*\d*$")
+_CATEGORY_CODE_RE = re.compile(r"^([A-Z]{2,4})\s*(\d*)(?:\s|$)")
+_CATEGORY_NAME_RE = re.compile(r"^([A-Za-zÅÄÖåäö\s,]{2,25}?)\s+\d+$")
+
+# Options
+_SINGLE_OPTION_RE = re.compile(r"^[A-E1-9]$")
+_ION_RE = re.compile(r"^[A-Za-z]{1,2}\d*[+-]$")
+_BULLET_RE = re.compile(r"^[○●◯◉]\s*")
+_LETTER_PAREN_RE = re.compile(r"^[a-zA-Z]\)\s*")
+_LETTER_DOT_RE = re.compile(r"^[a-zA-Z]\.\s*")
+_ORPHAN_PAREN_RE = re.compile(r"^\)\s*")
+_TRAILING_PARENS_RE = re.compile(r"\)+\s*(och\s*)?$")
+_OPTION_SPLIT_RE = re.compile(r",\s+(?=[a-zåäö])")
+
+# Points
+_INLINE_POINTS_PAREN_RE = re.compile(r"\((\d+(?:[.,]\d+)?)\s*p\)")
+_INLINE_POINTS_RE = re.compile(r"\s(\d+(?:[.,]\d+)?)\s*p\b")
+_TOTAL_POINTS_RE = re.compile(r"\s*Totalpoäng:\s*[\d.,]+\s*")
+_POINTS_PAREN_RE = re.compile(r"\(\d+(?:[.,]\d+)?p\)")
+_POINTS_SUFFIX_RE = re.compile(r"\s+\d+(?:[.,]\d+)?p\b")
+_WHOLE_POINTS_RE = re.compile(r"\(\d+p\)")
+
+# Answer extraction in _finalize_question
+_WORD_LIMIT_RE = re.compile(r"\(Max\s+\d+\s+ord\)\s*(.+)$", re.DOTALL | re.IGNORECASE)
+_EMPTY_PARENS_ANSWER_RE = re.compile(r"\(\s*\)\s*(.+)$", re.DOTALL)
+_POINTS_ANSWER_RE = re.compile(r"\(\d+(?:[.,]\d+)?p\)\s*(.+)$", re.DOTALL)
+_INLINE_QA_RE = re.compile(r"\?\s*([^?]+?)(?:\s+[a-d]\)|$)")
+_NUMBERED_RE = re.compile(r"\d+[.:]\s*\w")
+_UPPER_LABELED_RE = re.compile(r"([A-Z])\.\s*(.+?)(?=\s+[A-Z]\.\s|$)")
+_LOWER_LABELED_RE = re.compile(r"([a-z])\)\s*(.+?)(?=\s+[a-z]\)\s|$)")
+_CLICK_IMAGE_RE = re.compile(r"Klicka på bilden.*")
+_HOTSPOT_ANSWER_RE = re.compile(r"^(\d+|[A-Za-z])(?:\s|$)")
+
+# Instruction text removed from question text
+_CHOOSE_OPTION_RE = re.compile(r"\s*Välj ett (eller flera )?alternativ:?\s*")
+_MARK_CORRECT_RE = re.compile(r"\s*Markera det korrekta alternativet\.?\s*")
+_HELP_RE = re.compile(r"\s*Hjälp\s*")
+
 
 class DISAParser:
     """Parser for DISA exam PDFs.
@@ -62,10 +143,50 @@ class DISAParser:
         self.X_QUESTION_NUMBER = 45
         self.X_OPTION = 70
 
+        # Per-page caches: PyMuPDF extraction is the expensive part, and the
+        # same page is read by several passes and helpers
+        self._pages: dict[int, Any] = {}
+        self._text_cache: dict[int, str] = {}
+        self._dict_cache: dict[int, dict] = {}
+        self._drawings_cache: dict[int, list] = {}
+        # Set when _get_sorted_blocks sees a green box on a question page
+        self._any_green_seen = False
+        # Set when a kept question ends up with a correct option
+        self._any_option_correct = False
+
     def close(self) -> None:
         """Close the PDF document."""
         self.doc.close()
 
+    def _page(self, page_num: int) -> Any:
+        """Get a page, reusing the page object across calls."""
+        page = self._pages.get(page_num)
+        if page is None:
+            page = self._pages[page_num] = self.doc[page_num]
+        return page
+
+    def _page_text(self, page_num: int) -> str:
+        """Get the plain text of a page (cached)."""
+        text = self._text_cache.get(page_num)
+        if text is None:
+            text = self._text_cache[page_num] = self._page(page_num).get_text()
+        return text
+
+    def _page_dict(self, page: Any) -> dict:
+        """Get the text dict of a page (cached), without image blocks."""
+        text_dict = self._dict_cache.get(page.number)
+        if text_dict is None:
+            text_dict = page.get_text("dict", flags=TEXT_DICT_FLAGS)
+            self._dict_cache[page.number] = text_dict
+        return text_dict
+
+    def _page_drawings(self, page: Any) -> list:
+        """Get the vector drawings of a page (cached)."""
+        drawings = self._drawings_cache.get(page.number)
+        if drawings is None:
+            drawings = self._drawings_cache[page.number] = page.get_drawings()
+        return drawings
+
     def parse(self) -> ParsedExam:
         """Parse the PDF and return a ParsedExam object."""
         self._detect_format()
@@ -82,9 +203,9 @@ class DISAParser:
 
     def _detect_format(self) -> None:
         """Detect the exam format based on first pages content."""
-        text = self.doc[0].get_text()
+        text = self._page_text(0)
         if len(self.doc) > 1:
-            text += self.doc[1].get_text()
+            text += self._page_text(1)
         if "LPG" in text and "Digital tentamen" in text:
             fmt = "LPG-digital"
         elif "TENTAMEN" in text:
@@ -97,14 +218,12 @@ class DISAParser:
 
     def _detect_graded(self) -> None:
         """Detect if the exam has been graded (has correct answers marked)."""
-        has_correct = any(
-            any(o.is_correct for o in q.options) for q in self.questions if q.options
-        )
-        if has_correct:
+        # Green boxes already seen while parsing the question pages settle it
+        if self._any_option_correct or self._any_green_seen:
             self.metadata.is_graded = True
             return
         for page_num in range(len(self.doc)):
-            if self._get_green_boxes(self.doc[page_num]):
+            if self._get_green_boxes(self._page(page_num)):
                 self.metadata.is_graded = True
                 return
 
@@ -112,14 +231,14 @@ class DISAParser:
         """Parse exam metadata from the first page."""
         if len(self.doc) < 1:
             return
-        text = self.doc[0].get_text()
-        match = re.search(r"Kurskod\s+([A-Z]{2,5}\d{3})", text)
+        text = self._page_text(0)
+        match = _COURSE_CODE_RE.search(text)
         if match:
             self.metadata.course_code = match.group(1)
-        match = re.search(r"TENTAMEN\s*\n\s*(.+?)(?:\n|$)", text)
+        match = _EXAM_TITLE_RE.search(text)
         if match:
             self.metadata.exam_title = match.group(1).strip()
-        match = re.search(r"Starttid\s+(\d{2}\.\d{2}\.\d{4})", text)
+        match = _START_DATE_RE.search(text)
         if match:
             self.metadata.date = match.group(1)
 
@@ -127,56 +246,55 @@ class DISAParser:
         """Parse the TOC table on pages 0-5 to get question types."""
         self.question_types = {}
 
-        # First pass: collect all numbers and types with their positions
-        all_numbers: list[tuple[int, int, int, int]] = []  # (page, x, y, num)
-        all_types: list[tuple[int, int, int, str]] = []  # (page, x, y, type)
-
-        for page_num in range(0, min(6, len(self.doc))):
-            page = self.doc[page_num]
-            text_dict = page.get_text("dict")
+        # Single pass: collect numbers and types with their positions per
+        # page, tallying the x positions used to locate the two columns
+        summary_pages = range(0, min(6, len(self.doc)))
+        page_numbers: list[list[tuple[int, int, int]]] = []  # (x, y, num)
+        page_types: list[list[tuple[int, int, str]]] = []  # (x, y, type)
+        numbers_by_x: dict[int, list[int]] = defaultdict(list)
+        type_x_counts: Counter[int] = Counter()
+
+        for page_num in summary_pages:
+            numbers: list[tuple[int, int, int]] = []
+            types: list[tuple[int, int, str]] = []
+            page_numbers.append(numbers)
+            page_types.append(types)
+            text_dict = self._page_dict(self._page(page_num))
             for block in text_dict.get("blocks", []):
                 if block.get("type") != 0:
                     continue
                 for line in block.get("lines", []):
                     for span in line.get("spans", []):
-                        bbox = span.get("bbox", [0, 0, 0, 0])
-                        x, y = bbox[0], bbox[1]
                         text = span.get("text", "").strip()
 
                         # Potential question number (1-3 digits, value 1-200)
-                        if re.match(r"^\d{1,3}$", text):
+                        if _QUESTION_NUMBER_RE.match(text):
                             num = int(text)
                             if 1 <= num <= 200:
-                                all_numbers.append((page_num, round(x), round(y), num))
+                                bbox = span.get("bbox", [0, 0, 0, 0])
+                                x = round(bbox[0])
+                                numbers.append((x, round(bbox[1]), num))
+                                numbers_by_x[x].append(num)
 
                         # Question type
-                        if text in QUESTION_TYPES:
-                            all_types.append((page_num, round(x), round(y), text))
+                        if text in QUESTION_TYPES_SET:
+                            bbox = span.get("bbox", [0, 0, 0, 0])
+                            x = round(bbox[0])
+                            types.append((x, round(bbox[1]), text))
+                            type_x_counts[x] += 1
 
         # Find the type column x-position (most common x for types)
-        type_x = None
-        if all_types:
-            type_x_positions = [x for _, x, _, _ in all_types]
-            type_x = max(set(type_x_positions), key=type_x_positions.count)
-
-        # Find the question number column x-position
-        # Group numbers by x position
-        numbers_by_x: dict[int, list[tuple[int, int, int]]] = {}
-        for page, x, y, num in all_numbers:
-            if x not in numbers_by_x:
-                numbers_by_x[x] = []
-            numbers_by_x[x].append((page, y, num))
+        type_x = type_x_counts.most_common(1)[0][0] if type_x_counts else None
 
         # Find the best candidate for question number column
         number_x = None
         best_score = 0
 
-        for x, nums in numbers_by_x.items():
+        for x, values in numbers_by_x.items():
             # Skip if this column is at/after the type column
             if type_x is not None and x >= type_x:
                 continue
 
-            values = [n for _, _, n in nums]
             # Score: prefer columns with more variety and larger numbers
             unique_values = len(set(values))
             has_large = any(v > 10 for v in values)
@@ -186,38 +304,41 @@ class DISAParser:
                 best_score = score
                 number_x = x
 
-        # Second pass: match numbers with types by y-position
-        for page_num in range(0, min(6, len(self.doc))):
-            # Get numbers and types for this page
-            page_numbers = [
-                (y, num)
-                for p, x, y, num in all_numbers
-                if p == page_num and (number_x is None or abs(x - number_x) < 15)
-            ]
-            page_types = [
-                (y, t)
-                for p, x, y, t in all_types
-                if p == page_num and (type_x is None or abs(x - type_x) < 20)
-            ]
-
-            # Match by y-position
-            for y_num, num in page_numbers:
-                for y_type, qtype in page_types:
-                    if abs(y_num - y_type) < 5:
-                        self.question_types[num] = qtype
-                        break
+        # Match numbers with types by y-position, page by page. Types are
+        # sorted by y so each number only looks at the types within 5 units;
+        # ties go to the type that comes first on the page, as before.
+        for numbers, types in zip(page_numbers, page_types):
+            column_types = sorted(
+                (y, i, t)
+                for i, (x, y, t) in enumerate(types)
+                if type_x is None or abs(x - type_x) < 20
+            )
+            type_ys = [y for y, _, _ in column_types]
+            for x, y_num, num in numbers:
+                if number_x is not None and abs(x - number_x) >= 15:
+                    continue
+                # Coordinates are rounded to ints, so |dy| < 5 is this window
+                lo = bisect_right(type_ys, y_num - 5)
+                hi = bisect_left(type_ys, y_num + 5)
+                if hi - lo == 1:
+                    self.question_types[num] = column_types[lo][2]
+                elif lo < hi:
+                    # The window can span several y values, and the (y, index)
+                    # order puts the lowest y first, not the first type on the
+                    # page, so pick that among the few candidates explicitly
+                    self.question_types[num] = min(column_types[lo:hi], key=lambda c: c[1])[2]
 
         # Fallback: if position-based matching found very few, try line-based
         if len(self.question_types) < 10:
             types = []
             numbers = []
-            for page_num in range(0, min(6, len(self.doc))):
-                lines = self.doc[page_num].get_text().split("\n")
+            for page_num in summary_pages:
+                lines = self._page_text(page_num).split("\n")
                 for line in lines:
                     line = line.strip()
-                    if line in QUESTION_TYPES:
+                    if line in QUESTION_TYPES_SET:
                         types.append(line)
-                    elif re.match(r"^\d{1,3}$", line):
+                    elif _QUESTION_NUMBER_RE.match(line):
                         num = int(line)
                         if 1 <= num <= 100:
                             numbers.append(num)
@@ -228,18 +349,10 @@ class DISAParser:
 
     def _find_first_question_page(self) -> int:
         """Find the page number where questions start."""
-        # Markers that indicate a question page (essay, MCQ, etc.)
-        question_markers = [
-            "Skriv in ditt svar",
-            "Totalpoäng:",
-            "Bifoga ritning",
-            "Välj ett alternativ",  # MCQ marker
-            "Välj ett eller flera",  # Multi-select MCQ marker
-        ]
         for page_num in range(len(self.doc)):
-            text = self.doc[page_num].get_text()
-            if any(m in text for m in question_markers):
-                if re.search(r"^\d{1,3}\s+\w", text, re.MULTILINE):
+            text = self._page_text(page_num)
+            if _QUESTION_PAGE_MARKER_RE.search(text):
+                if _QUESTION_LINE_RE.search(text):
                     return page_num
         return 3 if len(self.doc) > 3 else 1
 
@@ -247,28 +360,34 @@ class DISAParser:
         """Parse all questions from the exam."""
         start_page = self._find_first_question_page()
         current_question: Question | None = None
+        current_type = ""
         current_text_parts: list[str] = []
         current_answer_parts: list[str] = []  # Text in Georgia font (answer text)
         current_options: list[Option] = []
         current_blue_regions: list[tuple[int, int, int, int]] = []
         seen_questions: set[int] = set()
+        # Format thresholds are fixed once _detect_format has run
+        x_question_number = self.X_QUESTION_NUMBER
+        x_option = self.X_OPTION
 
         for page_num in range(start_page, len(self.doc)):
-            page = self.doc[page_num]
+            page = self._page(page_num)
             blocks = self._get_sorted_blocks(page)
             page_blue_regions = self._get_blue_regions(page)
 
             for block in blocks:
-                text = block["text"].strip()
+                # Block text is already whitespace-normalized and stripped
+                text = block["text"]
                 x_pos = block["x"]
-                if not text or self._is_header_footer(text):
+                is_correct = block["is_correct"]
+                if self._is_header_footer(text):
                     continue
 
-                is_question_number_pos = x_pos < self.X_QUESTION_NUMBER
-                is_option_pos = x_pos >= self.X_OPTION
+                is_question_number_pos = x_pos < x_question_number
+                is_option_pos = x_pos >= x_option
 
-                q_match = re.match(r"^(\d{1,3})(?:\s+(.*))?$", text)
-                q_match_merged = re.match(r"^(\d{1,3})([A-Za-z].*)$", text)
+                q_match = _QUESTION_HEAD_RE.match(text)
+                q_match_merged = _QUESTION_HEAD_MERGED_RE.match(text)
 
                 if is_question_number_pos and (q_match or q_match_merged):
                     if q_match:
@@ -315,6 +434,7 @@ class DISAParser:
                             page_num=page_num,
                             y_position=block["y"],
                         )
+                        current_type = q_type
                         current_text_parts = initial_text
                         current_answer_parts = []
                         current_options = []
@@ -323,20 +443,20 @@ class DISAParser:
 
                 if current_question:
                     if "Totalpoäng:" in text:
-                        match = POINTS_PATTERN.search(text)
+                        match = POINTS_SEARCH(text)
                         if match:
                             current_question.points = float(
                                 match.group(1).replace(",", ".")
                             )
                     # Special handling for Textalternativ (dropdown) questions
-                    elif current_question.question_type == "Textalternativ":
+                    elif current_type == "Textalternativ":
                         # Skip dropdown option lists (high x, starts with "(")
                         if x_pos >= 200 and text.startswith("("):
                             continue
                         # Selected dropdown answers at x ~65-67 with is_correct
                         # These are single-word selections, not statement text
                         if (
-                            block.get("is_correct")
+                            is_correct
                             and 63 < x_pos < 68
                             and len(text) < 50
                             and not text.startswith("(")
@@ -346,11 +466,9 @@ class DISAParser:
                         elif not self._is_skippable(text):
                             current_text_parts.append(text)
                     # Special handling for Sant/Falskt compound questions
-                    elif current_question.question_type == "Sant/Falskt":
-                        if text in ("Sant", "Falskt"):
-                            opt = Option(
-                                text=text, is_correct=block.get("is_correct", False)
-                            )
+                    elif current_type == "Sant/Falskt":
+                        if text in _SANT_FALSKT:
+                            opt = Option(text=text, is_correct=is_correct)
                             current_options.append(opt)
                         elif not self._is_skippable(text):
                             current_text_parts.append(text)
@@ -361,19 +479,13 @@ class DISAParser:
                     else:
                         if not self._is_skippable(text):
                             # For Textfält/Textområde: green checkmark marks correct answer
-                            txt_types = [
-                                "Textfält",
-                                "Textområde",
-                                "Textfält i bild",
-                                "Sifferfält",
-                            ]
                             if (
-                                block.get("is_correct")
-                                and current_question.question_type in txt_types
+                                is_correct
+                                and current_type in _TXT_TYPES
                             ):
                                 current_answer_parts.append(text)
                             # Track answer-font text separately
-                            elif block.get("is_answer_font"):
+                            elif block["is_answer_font"]:
                                 current_answer_parts.append(text)
                             else:
                                 current_text_parts.append(text)
@@ -395,17 +507,14 @@ class DISAParser:
     def _get_green_boxes(self, page: Any) -> list[tuple[float, float]]:
         """Get green box positions (correct answer markers)."""
         green_boxes = []
-        for path in page.get_drawings():
+        max_r, min_g, max_b = GREEN_THRESHOLD
+        for path in self._page_drawings(page):
             fill = path.get("fill")
             rect = path.get("rect")
             if not fill or not rect:
                 continue
             r, g, b = fill
-            if (
-                r < GREEN_THRESHOLD[0]
-                and g > GREEN_THRESHOLD[1]
-                and b < GREEN_THRESHOLD[2]
-            ):
+            if r < max_r and g > min_g and b < max_b:
                 green_boxes.append((rect[1], rect[3]))
         return green_boxes
 
@@ -418,17 +527,14 @@ class DISAParser:
             List of (x, y, radius) tuples.
         """
         centers = []
-        for path in page.get_drawings():
+        max_r, min_g, max_b = GREEN_THRESHOLD
+        for path in self._page_drawings(page):
             fill = path.get("fill")
             rect = path.get("rect")
             if not fill or not rect:
                 continue
             r, g, b = fill
-            if (
-                r < GREEN_THRESHOLD[0]
-                and g > GREEN_THRESHOLD[1]
-                and b < GREEN_THRESHOLD[2]
-            ):
+            if r < max_r and g > min_g and b < max_b:
                 x1, y1, x2, y2 = rect
                 w, h = x2 - x1, y2 - y1
                 # Only small checkmark boxes (typical size 10-20px)
@@ -446,7 +552,7 @@ class DISAParser:
             List of (x, y, w, h) tuples.
         """
         blue_regions = []
-        for path in page.get_drawings():
+        for path in self._page_drawings(page):
             rect = path.get("rect")
             if not rect:
                 continue
@@ -488,7 +594,7 @@ class DISAParser:
             sorted by y position.
         """
         dropdowns = []
-        for d in page.get_drawings():
+        for d in self._page_drawings(page):
             rect = d.get("rect")
             color = d.get("color")
             items = d.get("items", [])
@@ -534,9 +640,10 @@ class DISAParser:
         dropdowns = self._get_dropdown_boxes(page)
         if not dropdowns:
             return False
+        choice_keys = [f"choices{i + 1}" for i in range(len(dropdowns))]
 
         # Get all text spans with position and color
-        text_dict = page.get_text("dict")
+        text_dict = self._page_dict(page)
         spans = []
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
@@ -545,7 +652,7 @@ class DISAParser:
                 for span in line.get("spans", []):
                     text = span["text"]
                     # Skip page numbers like "13/25"
-                    if re.match(r"^\d+/\d+$", text.strip()):
+                    if _PAGE_NUMBER_RE.match(text.strip()):
                         continue
                     spans.append(
                         {
@@ -556,31 +663,42 @@ class DISAParser:
                         }
                     )
 
-        # Sort spans by y then x
+        # Sort spans by y then x, so y ranges can be bisected
         spans.sort(key=lambda s: (s["bbox"][1], s["bbox"][0]))
+        span_ys = [s["bbox"][1] for s in spans]
+        rects = [
+            (r["x0"], r["y0"], r["x1"], r["y1"]) for r in (dd["rect"] for dd in dropdowns)
+        ]
+
+        # Index of the first dropdown containing each span (-1 if none), and
+        # the text of the first span inside each dropdown (its selected value)
+        container = [-1] * len(spans)
+        selected_texts = []
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            # The first span inside the box wins, even if it strips to ""
+            selected = None
+            for k in range(bisect_right(span_ys, y0), bisect_left(span_ys, y1)):
+                if x0 < spans[k]["bbox"][0] < x1:
+                    if selected is None:
+                        selected = spans[k]["text"].strip()
+                    if container[k] < 0:
+                        container[k] = i
+            selected_texts.append(selected or "")
 
         # Find the question number line to determine where this question starts
-        q_num = question.number
+        # The number alone, or followed by capitalized text
+        question_start_re = re.compile(rf"^{question.number}(?:\s*$|\s+[A-Z])")
         question_start_y = 0
         for span in spans:
             text = span["text"].strip()
-            if re.match(rf"^{q_num}\s*$", text) or re.match(rf"^{q_num}\s+[A-Z]", text):
+            if question_start_re.match(text):
                 question_start_y = span["bbox"][1]
                 break
 
         # Extract selected value from each dropdown
         choices = {}
-        for i, dd in enumerate(dropdowns):
-            rect = dd["rect"]
-            choice_key = f"choices{i + 1}"
-
-            # Find text inside dropdown box
-            selected = ""
-            for span in spans:
-                sb = span["bbox"]
-                if rect["x0"] < sb[0] < rect["x1"] and rect["y0"] < sb[1] < rect["y1"]:
-                    selected = span["text"].strip()
-                    break
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            selected = selected_texts[i]
 
             # Find options after dropdown - look for "(" followed by comma-separated list
             # The options are in parentheses, with the correct answer in green
@@ -589,35 +707,29 @@ class DISAParser:
 
             # Find next dropdown y position (or large gap = end of section)
             next_dd_y = 9999
-            if i + 1 < len(dropdowns):
-                next_dd_y = dropdowns[i + 1]["rect"]["y0"]
+            if i + 1 < len(rects):
+                next_dd_y = rects[i + 1][1]
 
             # Collect text starting with "(" after this dropdown
             options_parts = []
             in_options = False
             paren_depth = 0
 
-            for span in spans:
-                sb = span["bbox"]
+            # From just above this dropdown down to the next one
+            for k in range(bisect_left(span_ys, y0 - 5), bisect_right(span_ys, next_dd_y - 15)):
+                span = spans[k]
                 text = span["text"]
-                y = sb[1]
-                x = sb[0]
+                x, y = span["bbox"][:2]
 
-                # Skip text before dropdown
-                if y < rect["y0"] - 5:
-                    continue
-                # Stop at next dropdown
-                if y > next_dd_y - 15:
-                    break
                 # Skip text inside dropdown box
-                if rect["x0"] < x < rect["x1"] and rect["y0"] < y < rect["y1"]:
+                if x0 < x < x1 and y0 < y < y1:
                     continue
 
                 # Look for opening paren to start options
                 if not in_options:
-                    if "(" in text:
+                    idx = text.find("(")
+                    if idx >= 0:
                         in_options = True
-                        idx = text.index("(")
                         after_paren = text[idx + 1:]
                         paren_depth = 1 + after_paren.count("(") - after_paren.count(")")
                         if after_paren.strip():
@@ -637,73 +749,58 @@ class DISAParser:
             if options_parts:
                 full_text = " ".join(options_parts)
                 # Remove trailing )) och, ) och, )), ) etc.
-                full_text = re.sub(r"\)+\s*(och\s*)?$", "", full_text)
+                full_text = _TRAILING_PARENS_RE.sub("", full_text)
                 # Split by comma (but not commas inside parentheses)
                 # Simple approach: split by ", " followed by lowercase letter
-                raw_opts = re.split(r",\s+(?=[a-zåäö])", full_text)
+                raw_opts = _OPTION_SPLIT_RE.split(full_text)
                 # Clean up options - remove empty, very short, or duplicates
                 seen = set()
                 for opt in raw_opts:
                     opt = opt.strip()
                     # Remove trailing ) if unbalanced
-                    while opt.count(")") > opt.count("(") and opt.endswith(")"):
+                    unbalanced = opt.count(")") - opt.count("(")
+                    while unbalanced > 0 and opt.endswith(")"):
                         opt = opt[:-1].strip()
+                        unbalanced -= 1
                     if opt and len(opt) > 2 and opt not in seen:
                         seen.add(opt)
                         options.append(opt)
 
             if selected:
-                choices[choice_key] = DropdownChoice(answer=selected, options=options)
+                choices[choice_keys[i]] = DropdownChoice(answer=selected, options=options)
 
         if not choices:
             return False
 
         # Build question text with ${choicesN} placeholders
         # Structure: main question + "label ${choices1} och ${choices2}\n\nlabel2 ${choices3}..."
-        first_dd = dropdowns[0]
-
         # Collect main question text (before first dropdown)
         main_question_parts = []
-        for span in spans:
-            sb = span["bbox"]
-            y = sb[1]
-            if question_start_y < y < first_dd["rect"]["y0"] - 5:
-                text = span["text"].strip()
-                # Skip category markers like "IH 1"
-                if not re.match(r"^[A-Z]{2,3}\s*\d*$", text):
-                    main_question_parts.append(span["text"])
+        lo = bisect_right(span_ys, question_start_y)
+        for k in range(lo, bisect_left(span_ys, rects[0][1] - 5)):
+            text = spans[k]["text"]
+            # Skip category markers like "IH 1"
+            if not _CATEGORY_MARKER_RE.match(text.strip()):
+                main_question_parts.append(text)
 
         main_question = " ".join(main_question_parts).strip()
-        main_question = re.sub(r"\s+", " ", main_question)
+        main_question = _WHITESPACE_RE.sub(" ", main_question)
 
         # Group dropdowns by vertical sections (similar y = same line)
         sections = []  # List of lists of (dropdown_idx, label)
         current_section = []
         prev_y = None
 
-        for i, dd in enumerate(dropdowns):
-            rect = dd["rect"]
-            y = rect["y0"]
-
-            # Find label text before this dropdown
+        for i, (x0, y, _x1, _y1) in enumerate(rects):
+            # Find label text before this dropdown: on the same line, to the
+            # left, and not inside a previous dropdown
             label = ""
-            for span in spans:
-                sb = span["bbox"]
-                sy = sb[1]
-                sx = sb[0]
-                text = span["text"].strip()
-
-                # Label should be on same line as dropdown, to the left
-                if abs(sy - y) < 25 and sx < rect["x0"] - 5:
-                    # Skip if inside previous dropdown
-                    is_inside_prev = False
-                    for j in range(i):
-                        pr = dropdowns[j]["rect"]
-                        if pr["x0"] < sx < pr["x1"] and pr["y0"] < sy < pr["y1"]:
-                            is_inside_prev = True
-                            break
-                    if not is_inside_prev and text and not text.startswith("("):
-                        label = text.strip()
+            for k in range(bisect_right(span_ys, y - 25), bisect_left(span_ys, y + 25)):
+                span = spans[k]
+                if span["bbox"][0] < x0 - 5 and not 0 <= container[k] < i:
+                    text = span["text"].strip()
+                    if text and not text.startswith("("):
+                        label = text
 
             # Check if this is same section as previous (within 80px vertically)
             if prev_y is None or abs(y - prev_y) > 80:
@@ -724,9 +821,8 @@ class DISAParser:
         dsl_lines = []
         for section in sections:
             line_parts = []
-            for idx, (dd_idx, label) in enumerate(section):
-                choice_key = f"choices{dd_idx + 1}"
-                part = f"${{{choice_key}}}"
+            for dd_idx, label in section:
+                part = f"${{{choice_keys[dd_idx]}}}"
                 if label:
                     part = f"{label} {part}"
                 line_parts.append(part)
@@ -745,15 +841,18 @@ class DISAParser:
 
     def _get_sorted_blocks(self, page: Any) -> list[dict]:
         """Get text blocks sorted by position with correctness metadata."""
-        text_dict = page.get_text("dict")
+        text_dict = self._page_dict(page)
         blocks = []
         green_boxes = self._get_green_boxes(page)
+        if green_boxes:
+            self._any_green_seen = True
 
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
                 continue
             bbox = block.get("bbox")
-            block_text = ""
+            # Non-empty span texts, joined once at the end of the block
+            block_parts: list[str] = []
             has_correct = False
             has_incorrect = False
             is_answer_font = False
@@ -761,10 +860,11 @@ class DISAParser:
             for line in block.get("lines", []):
                 for span in line.get("spans", []):
                     span_text = span.get("text", "")
-                    block_text += span_text
-                    if any(m in span_text for m in CORRECT_MARKERS):
+                    if span_text:
+                        block_parts.append(span_text)
+                    if not CORRECT_MARKERS.isdisjoint(span_text):
                         has_correct = True
-                    if any(m in span_text for m in INCORRECT_MARKERS):
+                    if not INCORRECT_MARKERS.isdisjoint(span_text):
                         has_incorrect = True
                     # Georgia font indicates answer text in txt/essay questions
                     font = span.get("font", "")
@@ -776,16 +876,17 @@ class DISAParser:
                         has_correct = True
                         is_answer_font = True
                 # Add space between lines to prevent word merging
-                if block_text and not block_text.endswith((" ", "\n", "\t")):
-                    block_text += " "
+                if block_parts and not block_parts[-1].endswith((" ", "\n", "\t")):
+                    block_parts.append(" ")
 
+            block_text = "".join(block_parts)
             block_y = bbox[1]
             if any(abs(block_y - gy) < 20 for gy, _ in green_boxes):
                 has_correct = True
 
             if block_text.strip():
                 # Normalize whitespace to single spaces
-                block_text = re.sub(r"\s+", " ", block_text).strip()
+                block_text = _WHITESPACE_RE.sub(" ", block_text).strip()
                 blocks.append(
                     {
                         "text": block_text,
@@ -801,9 +902,9 @@ class DISAParser:
     def _is_header_footer(self, text: str) -> bool:
         """Check if text is a header or footer to skip."""
         text = text.strip()
-        if re.match(r"^LPG\d+", text):
+        if _LPG_HEADER_RE.match(text):
             return True
-        if re.match(r"^\d+/\d+$", text):
+        if _PAGE_NUMBER_RE.match(text):
             return True
         if "Candidate" in text or "Digital tentamen" in text:
             return True
@@ -818,7 +919,7 @@ class DISAParser:
             "Använd följande kod:"
         ):
             return True
-        if re.match(r"^[\d\s]+$", text):
+        if _DIGITS_ONLY_RE.match(text):
             return True
         return False
 
@@ -840,10 +941,10 @@ class DISAParser:
         ]
         if any(text.startswith(w) for w in question_words):
             return ""
-        code_match = re.match(r"^([A-Z]{2,4})\s*(\d*)(?:\s|$)", text)
+        code_match = _CATEGORY_CODE_RE.match(text)
         if code_match:
             return code_match.group(1)
-        cat_match = re.match(r"^([A-Za-zÅÄÖåäö\s,]{2,25}?)\s+\d+$", text)
+        cat_match = _CATEGORY_NAME_RE.match(text)
         if cat_match:
             return cat_match.group(1).strip()
         return ""
@@ -852,10 +953,10 @@ class DISAParser:
         """Check if text looks like an answer option."""
         text = text.strip()
         # Single letters A-E or digits 1-9 are valid options (image-based MCQ)
-        if re.match(r"^[A-E1-9]$", text):
+        if _SINGLE_OPTION_RE.match(text):
             return True
         # Chemical ion notation like H+, K+, Na+, Ca2+, Mg2+ (short but valid)
-        if re.match(r"^[A-Za-z]{1,2}\d*[+-]$", text):
+        if _ION_RE.match(text):
             return True
         if len(text) < 3 or len(text) > 300:
             return False
@@ -891,7 +992,7 @@ class DISAParser:
             return False
         if any(text.startswith(w) for w in question_starts) and len(text) > 60:
             return False
-        if re.match(r"^[○●◯◉]\s*", text) or re.match(r"^[a-zA-Z]\)\s*", text):
+        if _BULLET_RE.match(text) or _LETTER_PAREN_RE.match(text):
             return True
         # Accept texts up to 250 chars as potential options
         if len(text) < 250:
@@ -900,11 +1001,11 @@ class DISAParser:
 
     def _extract_inline_points(self, text: str, question: Question) -> None:
         """Extract points from inline text."""
-        match = re.search(r"\((\d+(?:[.,]\d+)?)\s*p\)", text)
+        match = _INLINE_POINTS_PAREN_RE.search(text)
         if match:
             question.points = float(match.group(1).replace(",", "."))
             return
-        match = re.search(r"\s(\d+(?:[.,]\d+)?)\s*p\b", text)
+        match = _INLINE_POINTS_RE.search(text)
         if match:
             question.points = float(match.group(1).replace(",", "."))
 
@@ -922,7 +1023,7 @@ class DISAParser:
 
         # Special handling for Textalternativ (dropdown) questions
         if question.question_type == "Textalternativ" and question.page_num >= 0:
-            page = self.doc[question.page_num]
+            page = self._page(question.page_num)
             if self._parse_dropdown_question(question, page):
                 # Successfully parsed dropdowns, done
                 return
@@ -964,9 +1065,7 @@ class DISAParser:
             if question.question_type in font_answer_types:
                 answer_text = ", ".join(answer_parts)
 
-        word_limit_match = re.search(
-            r"\(Max\s+\d+\s+ord\)\s*(.+)$", full_text, re.DOTALL | re.IGNORECASE
-        )
+        word_limit_match = _WORD_LIMIT_RE.search(full_text)
         if (
             not answer_text
             and word_limit_match
@@ -985,34 +1084,32 @@ class DISAParser:
                     break
 
         if not answer_text:
-            match = re.search(r"\(\s*\)\s*(.+)$", full_text, re.DOTALL)
+            match = _EMPTY_PARENS_ANSWER_RE.search(full_text)
             if match:
                 answer_text = match.group(1).strip()
                 question_text = full_text[: match.start()].strip()
 
         if not answer_text:
-            match = re.search(r"\(\d+(?:[.,]\d+)?p\)\s*(.+)$", full_text, re.DOTALL)
+            match = _POINTS_ANSWER_RE.search(full_text)
             if match and len(match.group(1)) > 3:
                 answer_text = match.group(1).strip()
                 question_text = full_text[: match.start()].strip()
 
         if not answer_text:
-            inline_qa = re.findall(r"\?\s*([^?]+?)(?:\s+[a-d]\)|$)", full_text)
+            inline_qa = _INLINE_QA_RE.findall(full_text)
             if inline_qa and len(inline_qa) >= 2:
                 answers = [a.strip() for a in inline_qa if a.strip()]
                 if answers:
                     answer_text = " | ".join(answers)
 
         if answer_text:
-            answer_text = re.sub(
-                r"\s*Totalpoäng:\s*[\d.,]+\s*", "", answer_text
-            ).strip()
+            answer_text = _TOTAL_POINTS_RE.sub("", answer_text).strip()
 
         essay_types = ["Essä", "Essäfråga", "Kortsvarsfråga", "Textområde"]
         if question.question_type in essay_types and options and not answer_text:
             opt_texts = [o.text for o in options]
             combined = " ".join(opt_texts)
-            has_numbered = re.search(r"\d+[.:]\s*\w", combined)
+            has_numbered = _NUMBERED_RE.search(combined)
             has_correct_markers = any(o.is_correct for o in options)
             if has_numbered or (len(options) <= 3 and not has_correct_markers):
                 answer_text = combined
@@ -1036,9 +1133,7 @@ class DISAParser:
             and not answer_text
         ):
             # Pattern 1: "A. content B. content" format
-            labeled_matches = re.findall(
-                r"([A-Z])\.\s*(.+?)(?=\s+[A-Z]\.\s|$)", full_text + " "
-            )
+            labeled_matches = _UPPER_LABELED_RE.findall(full_text + " ")
             if len(labeled_matches) >= 2:
                 answers = [
                     m[1].strip() for m in labeled_matches if len(m[1].strip()) > 5
@@ -1048,9 +1143,7 @@ class DISAParser:
 
             # Pattern 2: "a) content b) content" format
             if not answer_text:
-                lowercase_matches = re.findall(
-                    r"([a-z])\)\s*(.+?)(?=\s+[a-z]\)\s|$)", full_text + " "
-                )
+                lowercase_matches = _LOWER_LABELED_RE.findall(full_text + " ")
                 if len(lowercase_matches) >= 2:
                     answers = [
                         m[1].strip()
@@ -1078,9 +1171,9 @@ class DISAParser:
                 parts = full_text.split("?", 1)
                 if len(parts) > 1:
                     after_q = parts[1].strip()
-                    after_q = re.sub(r"\(\d+p\)", "", after_q).strip()
-                    after_q = re.sub(r"Klicka på bilden.*", "", after_q).strip()
-                    answer_match = re.match(r"^(\d+|[A-Za-z])(?:\s|$)", after_q)
+                    after_q = _WHOLE_POINTS_RE.sub("", after_q).strip()
+                    after_q = _CLICK_IMAGE_RE.sub("", after_q).strip()
+                    answer_match = _HOTSPOT_ANSWER_RE.match(after_q)
                     if answer_match:
                         answer_text = answer_match.group(1)
                     elif 0 < len(after_q) < 50:
@@ -1102,19 +1195,19 @@ class DISAParser:
         """Parse a single answer option from text."""
         text = text.strip()
         # Don't strip single-letter options (A-E) or single digits (1-9)
-        if not re.match(r"^[A-E1-9]$", text):
-            text = re.sub(r"^[○●◯◉]\s*", "", text)
-            text = re.sub(r"^[a-zA-Z]\)\s*", "", text)
-            text = re.sub(r"^[a-zA-Z]\.\s*", "", text)
+        if not _SINGLE_OPTION_RE.match(text):
+            text = _BULLET_RE.sub("", text)
+            text = _LETTER_PAREN_RE.sub("", text)
+            text = _LETTER_DOT_RE.sub("", text)
             # Strip orphan close-paren at start (PDF artifact)
-            text = re.sub(r"^\)\s*", "", text)
-        for m in CORRECT_MARKERS + INCORRECT_MARKERS:
+            text = _ORPHAN_PAREN_RE.sub("", text)
+        for m in ALL_MARKERS:
             text = text.replace(m, "")
         text = text.strip()
         # Allow single letters/digits for image-based MCQ
         if not text:
             return None
-        if len(text) < 2 and not re.match(r"^[A-E1-9]$", text):
+        if len(text) < 2 and not _SINGLE_OPTION_RE.match(text):
             return None
         return Option(text=text, is_correct=block.get("is_correct", False))
 
@@ -1122,6 +1215,9 @@ class DISAParser:
         """Identify correct answers from options."""
         correct = [opt for opt in question.options if opt.is_correct]
         if correct:
+            # Questions without text are dropped at the end of _parse_questions
+            if question.text.strip():
+                self._any_option_correct = True
             if question.question_type == QuestionType.FLERVALSFRÅGA.value:
                 question.correct_answer = correct[0].text if correct else None
             else:
@@ -1129,12 +1225,12 @@ class DISAParser:
 
     def _clean_question_text(self, text: str) -> str:
         """Clean up question text."""
-        text = re.sub(r"\s+", " ", text).strip()
-        text = re.sub(r"\s*Välj ett (eller flera )?alternativ:?\s*", " ", text)
-        text = re.sub(r"\s*Markera det korrekta alternativet\.?\s*", " ", text)
-        text = re.sub(r"\(\d+(?:[.,]\d+)?p\)", "", text)
-        text = re.sub(r"\s+\d+(?:[.,]\d+)?p\b", "", text)
-        text = re.sub(r"\s*Hjälp\s*", "", text)
+        text = _WHITESPACE_RE.sub(" ", text).strip()
+        text = _CHOOSE_OPTION_RE.sub(" ", text)
+        text = _MARK_CORRECT_RE.sub(" ", text)
+        text = _POINTS_PAREN_RE.sub("", text)
+        text = _POINTS_SUFFIX_RE.sub("", text)
+        text = _HELP_RE.sub("", text)
         return text.strip()
 
     def _extract_expected_answers(self, text: str) -> int | str:
@@ -1154,7 +1250,7 @@ class DISAParser:
             - "1+" = at least 1 answer
         """
         # Check for specific number patterns first (e.g., "Vilka två")
-        match = EXPECTED_ANSWERS_PATTERN.search(text)
+        match = EXPECTED_ANSWERS_SEARCH(text)
         if match:
             # Find first non-None group (pattern has multiple capture groups)
             num_str = None
@@ -1177,7 +1273,7 @@ class DISAParser:
                     return result
 
         # "Välj ett eller flera" = at least 1
-        if MULTIPLE_ANSWERS_PATTERN.search(text):
+        if MULTIPLE_ANSWERS_SEARCH(text):
             return "1+"
 
         return 1
@@ -6,9 +6,11 @@ import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import fitz
 import pytest
 
-from disa_parser import FixtureEncoder, MockDocument, MockPage, load_fixture
+from disa_parser import FixtureEncoder, MockDocument, MockPage, Option, load_fixture
+from disa_parser.fixture import dumps_fixture, fixture_encoder
 
 
 class TestMockPage:
@@ -37,6 +39,23 @@ class TestMockPage:
         assert len(drawings) == 1
         assert drawings[0]["fill"] == (0.1, 0.6, 0.1)
 
+    def test_get_text_dict_without_images(self):
+        """Test that image blocks are dropped when flags leave them out."""
+        text_block = {"type": 0, "bbox": [0, 0, 10, 10], "lines": []}
+        image_block = {"type": 1, "bbox": [0, 0, 10, 10], "image": b"png"}
+        page = MockPage({"text_dict": {"blocks": [text_block, image_block]}})
+        flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+        assert page.get_text("dict", flags=flags)["blocks"] == [text_block]
+        assert len(page.get_text("dict")["blocks"]) == 2
+
+    def test_drawings_restored_on_first_access(self):
+        """Test drawing lists are converted by get_drawings(), not on construction."""
+        drawing = {"rect": [1.0, 2.0, 3.0, 4.0], "fill": [0.1, 0.6, 0.1]}
+        page = MockPage({"text_dict": {"blocks": []}, "drawings": [drawing]})
+        assert drawing["rect"] == [1.0, 2.0, 3.0, 4.0]
+        assert page.get_drawings()[0]["rect"] == (1.0, 2.0, 3.0, 4.0)
+        assert page.get_drawings()[0]["fill"] == (0.1, 0.6, 0.1)
+
     def test_empty_page(self):
         """Test empty page."""
         page = MockPage({"text_dict": {"blocks": []}, "drawings": []})
@@ -97,6 +116,73 @@ class TestLoadFixture:
             assert isinstance(doc, MockDocument)
             assert len(doc) == 10
 
+    def test_load_image_bytes_roundtrip(self):
+        """Test image block payloads survive a dump/load roundtrip."""
+        fixture = {
+            "page_count": 1,
+            "pages": {
+                "0": {
+                    "text_dict": {"blocks": [{"type": 1, "image": b"\x89PNG"}]},
+                    "drawings": [],
+                }
+            },
+        }
+        doc = load_fixture(dumps_fixture(fixture).decode("utf-8"))
+        block = doc[0].get_text("dict")["blocks"][0]
+        assert block["image"] == b"\x89PNG"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_load_bytes_outside_image_blocks(self, monkeypatch, use_orjson: bool):
+        """Test __bytes__ markers outside image blocks are decoded too."""
+        import disa_parser.fixture as fixture_module
+
+        if not use_orjson:
+            monkeypatch.setattr(fixture_module, "orjson", None)
+        fixture = {
+            "page_count": 1,
+            "extra": {"blob": b"\x00\x01"},
+            "pages": {
+                "0": {
+                    "text_dict": {"blocks": [{"type": 1, "image": b"\x89PNG"}]},
+                    "drawings": [],
+                }
+            },
+        }
+        doc = load_fixture(dumps_fixture(fixture).decode("utf-8"))
+        assert doc._fixture["extra"]["blob"] == b"\x00\x01"
+        assert doc[0].get_text("dict")["blocks"][0]["image"] == b"\x89PNG"
+
+    def test_load_restores_drawing_tuples(self):
+        """Test drawing rect/fill/color come back as tuples from JSON."""
+        fixture = {
+            "page_count": 1,
+            "pages": {
+                "0": {
+                    "text_dict": {"blocks": []},
+                    "drawings": [{"rect": (1.0, 2.0, 3.0, 4.0), "fill": (0.1, 0.6, 0.1)}],
+                }
+            },
+        }
+        doc = load_fixture(dumps_fixture(fixture).decode("utf-8"))
+        drawing = doc[0].get_drawings()[0]
+        assert drawing["rect"] == (1.0, 2.0, 3.0, 4.0)
+        assert drawing["fill"] == (0.1, 0.6, 0.1)
+
+    def test_load_dict_restores_drawing_tuples(self):
+        """Test drawing lists in a plain dict fixture come back as tuples."""
+        fixture = {
+            "page_count": 1,
+            "pages": {
+                "0": {
+                    "text_dict": {"blocks": []},
+                    "drawings": [{"rect": [1.0, 2.0, 3.0, 4.0], "color": [0.8, 0.8, 0.8]}],
+                }
+            },
+        }
+        drawing = load_fixture(fixture)[0].get_drawings()[0]
+        assert drawing["rect"] == (1.0, 2.0, 3.0, 4.0)
+        assert drawing["color"] == (0.8, 0.8, 0.8)
+
 
 class TestFixtureEncoder:
     """Tests for FixtureEncoder."""
@@ -114,3 +200,30 @@ class TestFixtureEncoder:
         result = json.dumps(data, cls=FixtureEncoder)
         decoded = json.loads(result)
         assert decoded["rect"] == [1.0, 2.0, 3.0, 4.0]
+
+    def test_encoder_hook_rejects_unknown_types(self):
+        """Test the plain encoder hook raises TypeError like json expects."""
+        assert fixture_encoder(b"hi") == {"__bytes__": "aGk="}
+        with pytest.raises(TypeError):
+            fixture_encoder(object())
+
+    def test_encode_dataclass(self):
+        """Test encoding dataclasses such as answer options."""
+        data = {"options": [Option(text="A", is_correct=True)]}
+        decoded = json.loads(json.dumps(data, cls=FixtureEncoder))
+        assert decoded["options"] == [{"text": "A", "is_correct": True}]
+
+    def test_dumps_compact(self, sample_fixture_data: dict):
+        """Test compact output loads the same as indented output."""
+        compact = dumps_fixture(sample_fixture_data, pretty=False)
+        assert b"\n" not in compact
+        assert json.loads(compact) == json.loads(dumps_fixture(sample_fixture_data))
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_dumps_utf8_without_orjson(self, monkeypatch, pretty: bool):
+        """Test the stdlib fallback writes å/ä/ö as UTF-8, like orjson."""
+        import disa_parser.fixture as fixture_module
+
+        monkeypatch.setattr(fixture_module, "orjson", None)
+        data = dumps_fixture({"text": "Välj rätt svar"}, pretty=pretty)
+        assert "Välj rätt svar".encode() in data
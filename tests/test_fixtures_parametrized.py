@@ -7,7 +7,7 @@ Fixtures are stored in tests/fixtures/questions/ with naming:
     {course}-{exam_id}-{question_num:02d}.json.gz
 
 To add new fixtures, use:
-    uv run scripts/extract_question_fixtures.py path/to/exam.pdf -o tests/fixtures/questions/
+    uv run scripts/extract_question_fixtures.py path/to/exam.pdf -o tests/fixtures/questions/ --compress
 """
 
 from __future__ import annotations
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import fitz
 import pytest
 
-from disa_parser import ImageRef
-from disa_parser.images import ExtractedImage, QuestionImages
+from disa_parser import ImageRef, Question
+from disa_parser.images import (
+    ExtractedImage,
+    ImageExtractor,
+    QuestionImages,
+    associate_images,
+)
 
 
 class TestExtractedImage:
@@ -27,7 +33,7 @@ class TestExtractedImage:
         assert img.width == 90
         assert img.height == 100
         assert img.image_type == "png"
-        assert len(img.hash) == 12  # MD5 hash truncated
+        assert len(img.hash) == 12  # 6-byte BLAKE2b digest
 
     def test_area_calculation(self):
         """Test area calculation."""
@@ -150,6 +156,103 @@ class TestQuestionImages:
         assert qi.has_images() is True
 
 
+class TestImageExtractor:
+    """Tests for ImageExtractor."""
+
+    def test_borrowed_doc_left_open(self):
+        """Test close() does not close a document passed in by the caller."""
+        doc = fitz.open()
+        doc.new_page()
+        extractor = ImageExtractor("empty.pdf", doc=doc)
+        assert extractor.extract_all_images() == []
+        extractor.close()
+        assert not doc.is_closed
+        doc.close()
+
+    def test_tiny_images_skipped(self):
+        """Test images below the minimum size are skipped and remembered."""
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 10, 10), False)
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(50, 50, 60, 60), pixmap=pixmap)
+        extractor = ImageExtractor("tiny.pdf", doc=doc)
+        assert extractor.extract_all_images() == []
+        assert list(extractor._image_cache.values()) == [None]
+        doc.close()
+
+    def test_images_for_question_by_y_range(self):
+        """Test only images starting inside the question's range are returned."""
+        doc = fitz.open()
+        page = doc.new_page(width=600, height=800)
+        for width, y in ((40, 500), (41, 100), (42, 300)):
+            pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width, 40), False)
+            page.insert_image(fitz.Rect(50, y, 150, y + 50), pixmap=pixmap)
+        extractor = ImageExtractor("ranges.pdf", doc=doc)
+
+        first = extractor.get_images_for_question(1, 0, 110, 400, 800)
+        last = extractor.get_images_for_question(2, 0, 400, None, 800)
+
+        assert [img.bbox[1] for img in first.images] == [100, 300]
+        assert [img.bbox[1] for img in last.images] == [500]
+        doc.close()
+
+    def test_workers_match_serial(self, tmp_path):
+        """Test extracting with a process pool gives the serial result."""
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), False)
+        doc = fitz.open()
+        for _ in range(3):
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(50, 50, 150, 150), pixmap=pixmap)
+        pdf_path = tmp_path / "images.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        extractor = ImageExtractor(pdf_path)
+        serial = extractor.extract_all_images()
+        parallel = extractor.extract_all_images(workers=2)
+        extractor.close()
+
+        assert [img.page_num for img in serial] == [0, 1, 2]
+        assert [(img.page_num, img.bbox, img.hash) for img in parallel] == [
+            (img.page_num, img.bbox, img.hash) for img in serial
+        ]
+
+
+class TestAssociateImages:
+    """Tests for associate_images."""
+
+    @staticmethod
+    def _image(bbox: tuple[float, float, float, float]) -> ExtractedImage:
+        return ExtractedImage(
+            xref=1,
+            page_num=0,
+            bbox=bbox,
+            width=100,
+            height=100,
+            image_type="png",
+            data=b"x",
+        )
+
+    def test_images_assigned_by_y_range(self):
+        """Test images go to the question range containing their top edge."""
+        doc = fitz.open()
+        doc.new_page(width=600, height=800)
+        questions = [
+            Question(number=1, text="", question_type="", page_num=0, y_position=100),
+            Question(number=2, text="", question_type="", page_num=0, y_position=400),
+        ]
+        above_q1 = self._image((50, 80, 150, 180))  # Within the slack above Q1
+        in_q2 = self._image((50, 420, 150, 520))
+        paper = self._image((0, 0, 600, 800))
+
+        images, papers = associate_images(questions, [above_q1, in_q2, paper], doc)
+        doc.close()
+
+        assert images[1] == [above_q1]
+        assert images[2] == [in_q2]
+        assert papers == {1: paper}
+
+
 class TestImageRef:
     """Tests for ImageRef model."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
-from disa_parser import ExamMetadata, Option, ParsedExam, Question, QuestionType
+from disa_parser import ExamMetadata, HotspotRegion, ImageRef, Option, ParsedExam, Question, QuestionType
+from disa_parser.models import DropdownChoice
 
 
 class TestOption:
@@ -117,6 +120,37 @@ class TestQuestion:
         assert len(d["options"]) == 2
         assert d["options"][1]["is_correct"] is True
 
+    def test_to_dict_matches_element_to_dict(self):
+        """Test inlined element dicts match the element to_dict methods."""
+        image = ImageRef(path="q1.png", width=10, height=20, image_type="png")
+        region = HotspotRegion(x=1, y=2, width=3, height=4)
+        choice = DropdownChoice(answer="a", options=["a", "b"])
+        q = Question(
+            number=1,
+            text="Q",
+            question_type="Hotspot",
+            images=[image],
+            hotspot_regions=[region],
+            choices={"1": choice},
+        )
+        d = q.to_dict()
+        assert d["images"] == [image.to_dict()]
+        assert d["hotspot_regions"] == [region.to_dict()]
+        assert d["choices"] == {"1": choice.to_dict()}
+
+    def test_to_dict_compact(self):
+        """Test compact mode writes options and regions as lists."""
+        q = Question(
+            number=1,
+            text="Q",
+            question_type="Hotspot",
+            options=[Option(text="A", is_correct=True)],
+            hotspot_regions=[HotspotRegion(x=1, y=2, width=3, height=4)],
+        )
+        d = q.to_dict(compact=True)
+        assert d["options"] == [["A", True]]
+        assert d["hotspot_regions"] == [[1, 2, 3, 4]]
+
 
 class TestExamMetadata:
     """Tests for the ExamMetadata model."""
@@ -142,6 +176,12 @@ class TestExamMetadata:
         assert meta.date == ""
         assert meta.is_graded is False
 
+    def test_to_dict(self):
+        """Test to_dict matches dataclasses.asdict field for field."""
+        meta = ExamMetadata(course_code="BIO123", date="01.01.2024", is_graded=True)
+        assert meta.to_dict() == dataclasses.asdict(meta)
+        assert list(meta.to_dict()) == [f.name for f in dataclasses.fields(meta)]
+
 
 class TestParsedExam:
     """Tests for the ParsedExam model."""
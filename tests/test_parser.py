@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from disa_parser import DISAParser, MockDocument, load_fixture
+from disa_parser import DISAParser, MockDocument, MockPage, Question, load_fixture
 
 
 class TestDISAParser:
@@ -140,6 +140,31 @@ class TestColorDetection:
         assert blue_regions == []
         parser.close()
 
+    def test_drawings_fetched_once_per_page(self, mcq_fixture_data: dict, monkeypatch):
+        """Test that the drawing helpers share one get_drawings() call per page."""
+        doc = load_fixture(mcq_fixture_data)
+        parser = DISAParser(Path("test.pdf"), "biokemi", fixture=doc)
+        page = parser._page(3)
+        calls = []
+        original = page.get_drawings
+        monkeypatch.setattr(page, "get_drawings", lambda: calls.append(1) or original())
+        parser._get_green_boxes(page)
+        parser._get_blue_regions(page)
+        parser._get_dropdown_boxes(page)
+        assert len(calls) == 1
+        parser.close()
+
+    def test_page_caches_keyed_by_page_number(self, mcq_fixture_data: dict):
+        """Test that another page object for the same page reuses the caches."""
+        doc = load_fixture(mcq_fixture_data)
+        parser = DISAParser(Path("test.pdf"), "biokemi", fixture=doc)
+        green_boxes = parser._get_green_boxes(parser._page(3))
+        # A fresh page object with no data would find nothing if re-read
+        fresh = MockPage({}, number=3)
+        assert parser._get_green_boxes(fresh) == green_boxes
+        assert parser._page_dict(fresh) is parser._page_dict(parser._page(3))
+        parser.close()
+
 
 class TestHelperMethods:
     """Tests for parser helper methods."""
@@ -197,3 +222,45 @@ class TestHelperMethods:
         cleaned = parser._clean_question_text(text)
         assert "(2p)" not in cleaned
         parser.close()
+
+
+class TestDropdownParsing:
+    """Tests for Textalternativ dropdown parsing."""
+
+    @staticmethod
+    def _dropdown_doc(box_spans: list[str]) -> MockDocument:
+        """Build a one-page document with a single dropdown box at y 100-120."""
+        spans = [{"text": "1 Fyll i", "bbox": [40, 50, 100, 62], "color": 0}]
+        spans += [
+            {"text": text, "bbox": [110 + 20 * i, 104, 125 + 20 * i, 116], "color": 0}
+            for i, text in enumerate(box_spans)
+        ]
+        block = {"type": 0, "bbox": [40, 50, 300, 120], "lines": [{"spans": spans}]}
+        dropdown = {
+            "rect": (100, 100, 250, 120),
+            "color": (0.8, 0.8, 0.8),
+            "items": [("c",)] * 15,
+        }
+        return load_fixture(
+            {
+                "page_count": 1,
+                "pages": {"0": {"text_dict": {"blocks": [block]}, "drawings": [dropdown]}},
+            }
+        )
+
+    def test_selected_value(self):
+        """Test that the span inside the box becomes the selected answer."""
+        parser = DISAParser(Path("test.pdf"), "biokemi", fixture=self._dropdown_doc(["Ja"]))
+        question = Question(number=1, text="", question_type="Textalternativ")
+        assert parser._parse_dropdown_question(question, parser._page(0)) is True
+        assert question.choices["choices1"].answer == "Ja"
+        parser.close()
+
+    def test_first_span_in_box_wins_even_if_blank(self):
+        """Test that a leading whitespace span leaves the dropdown unanswered."""
+        doc = self._dropdown_doc([" ", "Ja"])
+        parser = DISAParser(Path("test.pdf"), "biokemi", fixture=doc)
+        question = Question(number=1, text="", question_type="Textalternativ")
+        assert parser._parse_dropdown_question(question, parser._page(0)) is False
+        assert not question.choices
+        parser.close()